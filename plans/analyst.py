@@ -120,18 +120,46 @@ class Univar:
         self.data = data
         self.name = name
 
+    @property
+    def data(self):
+        """The data vector. Setting new data clears cached assessments.
+
+        :return: n-D vector of data
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self.invalidate()
+
+    def invalidate(self):
+        """Clear cached assessments. Call it if data is modified in place.
+
+        :return: None
+        :rtype: None
+        """
+        self._freq_cache = None
+        self._nbins_cache = None
+        return None
+
     def nbins_fd(self):
         """This function computes the number of bins for histograms using the Freedman-Diaconis rule, which takes into account the interquartile range (IQR) of the data, in addition to its range.
 
         :return: number of bins for histogram using the Freedman-Diaconis rule
         :rtype: int
         """
-        iqr = np.subtract(*np.percentile(self.data, [75, 25]))
-        binsize = 2 * iqr * len(self.data) ** (-1 / 3)
-        # hack for non infinite values
-        if binsize == 0:
-            binsize = 100
-        return int(np.ceil((max(self.data) - min(self.data)) / binsize))
+        if self._nbins_cache is None:
+            iqr = np.subtract(*np.percentile(self.data, [75, 25]))
+            binsize = 2 * iqr * len(self.data) ** (-1 / 3)
+            # hack for non infinite values
+            if binsize == 0:
+                binsize = 100
+            self._nbins_cache = int(
+                np.ceil((max(self.data) - min(self.data)) / binsize)
+            )
+        return self._nbins_cache
 
     def nbins_sturges(self):
         """This function computes the number of bins using the Sturges rule, which assumes that the data follows a normal distribution and computes the number of bins based on its sample runsize.
@@ -287,8 +315,7 @@ class Univar:
         if specs is None:
             pass
         else:  # override default
-            for k in specs:
-                default_specs[k] = specs[k]
+            default_specs.update(specs)
         specs = default_specs
 
         # start plot
@@ -408,8 +435,7 @@ class Univar:
         if specs is None:
             pass
         else:  # override default
-            for k in specs:
-                default_specs[k] = specs[k]
+            default_specs.update(specs)
         specs = default_specs
         # start plot
         fig = plt.figure(figsize=(specs["width"], specs["height"]))  # Width, Height
@@ -478,8 +504,7 @@ class Univar:
         if specs is None:
             pass
         else:  # override default
-            for k in specs:
-                default_specs[k] = specs[k]
+            default_specs.update(specs)
         specs = default_specs
 
         # process quantiles
@@ -639,6 +664,8 @@ class Univar:
         :return: result dataframe
         :rtype: :class:`pandas.DataFrame`
         """
+        if self._freq_cache is not None:
+            return self._freq_cache.copy()
         # compute percentiles
         vct_percentiles = np.arange(0, 100)
         # get CFC values
@@ -659,7 +686,8 @@ class Univar:
                 "Values": vct_cfc,
             }
         )
-        return df_result
+        self._freq_cache = df_result
+        return df_result.copy()
 
     def assess_basic_stats(self):
         dct = {
@@ -851,8 +879,7 @@ class Bivar:
         if specs is None:
             pass
         else:  # override default
-            for k in specs:
-                default_specs[k] = specs[k]
+            default_specs.update(specs)
         specs = default_specs
 
         # start plot
@@ -966,8 +993,7 @@ class Bivar:
         if specs is None:
             pass
         else:  # override default
-            for k in specs:
-                default_specs[k] = specs[k]
+            default_specs.update(specs)
         specs = default_specs
 
         # get some ranges
@@ -1514,8 +1540,7 @@ class Bayes:
         if specs is None:
             pass
         else:  # override default
-            for k in specs:
-                default_specs[k] = specs[k]
+            default_specs.update(specs)
         specs = default_specs
 
         # hunt some parameters
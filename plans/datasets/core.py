@@ -58,7 +58,7 @@ In a lacinia nisl. Mauris gravida ex quam, in porttitor lacus lobortis vitae.
 In a lacinia nisl.
 
 """
-import os, glob, copy
+import os, glob, copy, itertools
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -66,6 +66,11 @@ import matplotlib as mpl
 import warnings
 from plans.root import Collection, DataSet
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 def dataframe_prepro(dataframe):
     """Utility function for dataframe pre-processing.
 
@@ -77,13 +82,13 @@ def dataframe_prepro(dataframe):
     # fix headings
     dataframe.columns = dataframe.columns.str.strip()
     # strip string fields
-    for i in range(len(dataframe.columns)):
-        # if data type is string
-        if str(dataframe.dtypes.iloc[i]) == "base_object":
-            # strip all data
-            dataframe[dataframe.columns[i]] = dataframe[
-                dataframe.columns[i]
-            ].str.strip()
+    str_columns = [
+        c
+        for c in dataframe.select_dtypes(include=["object", "string"]).columns
+        if pd.api.types.infer_dtype(dataframe[c], skipna=True) == "string"
+    ]
+    if len(str_columns) > 0:
+        dataframe[str_columns] = dataframe[str_columns].apply(lambda s: s.str.strip())
     return dataframe
 
 def get_colors(size=10, cmap="tab20", randomize=True):
@@ -96,7 +101,6 @@ def get_colors(size=10, cmap="tab20", randomize=True):
     :return: list of random colors
     :rtype: list
     """
-    import matplotlib.colors as mcolors
     # Choose a colormap from matplotlib
     _cmap = plt.get_cmap(cmap)
     # Generate a list of random numbers between 0 and 1
@@ -104,11 +108,287 @@ def get_colors(size=10, cmap="tab20", randomize=True):
         _lst_vals = np.random.rand(size)
     else:
         _lst_vals = np.linspace(0, 1, num=size)
-    # Use the colormap to convert the random numbers to colors
-    _lst_colors = [mcolors.to_hex(_cmap(x)) for x in _lst_vals]
+    # Use the colormap to convert all numbers to RGB bytes at once
+    _rgb = np.round(_cmap(_lst_vals)[:, :3] * 255).astype(np.uint8)
+    _lst_colors = ["#{:02x}{:02x}{:02x}".format(*c) for c in _rgb.tolist()]
     return _lst_colors
 
 
+def _label_epochs_numpy(isna, gapsize):
+    """Label epochs of a gap mask using vectorized NumPy passes.
+
+    :param isna: gap mask
+    :type isna: :class:`numpy.ndarray`
+    :param gapsize: minimum size of gaps that split epochs
+    :type gapsize: int
+    :return: epoch ids (0 = gap epoch)
+    :rtype: :class:`numpy.ndarray`
+    """
+    # Label continuous chunks of data: each valid record opens a new chunk
+    chunks = np.cumsum(~isna)
+
+    # Get the size of the gap that closes each chunk
+    gap_len = (
+        pd.Series(isna.astype(np.int32))
+        .groupby(chunks)
+        .transform("sum")
+        .to_numpy()
+    )
+
+    # get skip hint: records inside gaps as large as the gap size
+    skip = isna & (gap_len >= gapsize)
+
+    # a new epoch starts after every skipped gap
+    starts = np.zeros(len(skip), dtype=bool)
+    starts[1:] = skip[:-1] & ~skip[1:]
+    return np.where(skip, 0, 1 + np.cumsum(starts)).astype(np.int32)
+
+
+def _label_epochs_loop(isna, gapsize):
+    """Label epochs of a gap mask in a single sequential scan.
+
+    :param isna: gap mask
+    :type isna: :class:`numpy.ndarray`
+    :param gapsize: minimum size of gaps that split epochs
+    :type gapsize: int
+    :return: epoch ids (0 = gap epoch)
+    :rtype: :class:`numpy.ndarray`
+    """
+    size = len(isna)
+    epoch_id = np.zeros(size, dtype=np.int32)
+    counter = 1
+    i = 0
+    while i < size:
+        if isna[i]:
+            # find the end of the gap
+            j = i
+            while j < size and isna[j]:
+                j += 1
+            if j - i >= gapsize:
+                # skip the gap and open a new epoch after it
+                counter += 1
+            else:
+                epoch_id[i:j] = counter
+            i = j
+        else:
+            epoch_id[i] = counter
+            i += 1
+    return epoch_id
+
+
+# use the compiled scan if numba is available
+if njit is None:
+    _label_epochs = _label_epochs_numpy
+else:
+    _label_epochs = njit(cache=True)(_label_epochs_loop)
+
+
+def _get_buckets(dt_values, freq):
+    """Get the time window (bucket) of each timestamp for a given frequency.
+
+    :param dt_values: timestamps, not necessarily sorted
+    :type dt_values: :class:`numpy.ndarray`
+    :param freq: Pandas-like alias frequency (e.g., ``D``, ``MS``, ``YS``)
+    :type freq: str
+    :return: bucket ids of each timestamp and the datetime index of buckets
+    :rtype: tuple
+    """
+    # the pandas grouper expects sorted timestamps
+    order = np.argsort(dt_values, kind="stable")
+    sr_aux = pd.Series(order, index=pd.DatetimeIndex(dt_values[order]))
+    grouped = sr_aux.groupby(pd.Grouper(freq=freq))
+    # map ids back to the incoming order
+    ids = np.empty(len(order), dtype=np.int64)
+    ids[order] = grouped.ngroup().to_numpy()
+    return ids, grouped.size().index
+
+
+def _group_reduce(vct, ids, size, how="sum"):
+    """Reduce values by group ids in a single C-level pass, ignoring NaN.
+
+    :param vct: values
+    :type vct: :class:`numpy.ndarray`
+    :param ids: group ids (from 0 to ``size - 1``) of each value
+    :type ids: :class:`numpy.ndarray`
+    :param size: number of groups
+    :type size: int
+    :param how: reduction. Options: ``sum``, ``mean`` and ``count``. Default is ``sum``
+    :type how: str
+    :return: reduced values by group (NaN for groups without valid values)
+    :rtype: :class:`numpy.ndarray`
+    """
+    mask = ~np.isnan(vct)
+    vct_count = np.bincount(ids, weights=mask, minlength=size)
+    if how == "count":
+        return vct_count
+    vct_sum = np.bincount(ids, weights=np.where(mask, vct, 0.0), minlength=size)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if how == "sum":
+            return np.where(vct_count > 0, vct_sum, np.nan)
+        elif how == "mean":
+            return vct_sum / np.where(vct_count > 0, vct_count, np.nan)
+    raise ValueError("how must be 'sum', 'mean' or 'count'")
+
+
+def _moving_stat(vct, window, stat="mean", min_periods=1):
+    """Get a trailing moving window statistic of a vector, ignoring NaN.
+
+    Same as ``pandas.Series.rolling(window, min_periods)`` followed by the statistic.
+    The mean is computed in a single cumulative-sum pass, other statistics are
+    reduced over a strided window view (no copies of windows).
+
+    :param vct: values
+    :type vct: :class:`numpy.ndarray`
+    :param window: number of records in the moving window
+    :type window: int
+    :param stat: statistic. Options: ``mean``, ``sum``, ``std``, ``min``, ``max`` and ``median``.
+        Default is ``mean``
+    :type stat: str
+    :param min_periods: minimum number of valid records in the window. Default is 1
+    :type min_periods: int
+    :return: moving statistic (NaN where there are not enough valid records)
+    :rtype: :class:`numpy.ndarray`
+    """
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    dct_funcs = {
+        "sum": np.nansum,
+        "std": lambda x, axis: np.nanstd(x, axis=axis, ddof=1),
+        "min": np.nanmin,
+        "max": np.nanmax,
+        "median": np.nanmedian,
+    }
+    if stat != "mean" and stat not in dct_funcs:
+        raise ValueError("stat must be one of: mean, {}".format(", ".join(dct_funcs)))
+    vct = np.asarray(vct, dtype=np.float64)
+    if len(vct) == 0:
+        return vct
+    mask = ~np.isnan(vct)
+    # count of valid records: the window of record i starts at max(i - window + 1, 0)
+    vct_ccount = np.concatenate(([0], np.cumsum(mask)))
+    vct_end = np.arange(1, len(vct) + 1)
+    vct_start = np.maximum(vct_end - window, 0)
+    vct_count = vct_ccount[vct_end] - vct_ccount[vct_start]
+    vct_valid = vct_count >= max(min_periods, 1)
+    if stat == "mean":
+        # window sums from cumulative sums padded with a leading zero
+        vct_csum = np.concatenate(([0.0], np.cumsum(np.where(mask, vct, 0.0))))
+        vct_sum = vct_csum[vct_end] - vct_csum[vct_start]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(vct_valid, vct_sum / vct_count, np.nan)
+    # left pad with NaN so every record gets a full window
+    vct_pad = np.concatenate((np.full(window - 1, np.nan), vct))
+    grd_windows = sliding_window_view(vct_pad, window)
+    with warnings.catch_warnings():
+        # windows without valid records yield NaN (masked below)
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        vct_stat = dct_funcs[stat](grd_windows, axis=-1)
+    return np.where(vct_valid, vct_stat, np.nan)
+
+
+def _decimate_minmax(vct_x, vct_y, n_buckets):
+    """Decimate a series for plotting, keeping the min and max records of each bucket.
+
+    :param vct_x: x values
+    :type vct_x: :class:`numpy.ndarray`
+    :param vct_y: y values
+    :type vct_y: :class:`numpy.ndarray`
+    :param n_buckets: number of evenly sized buckets of records
+    :type n_buckets: int
+    :return: decimated x and y values, in the original order (NaN dropped)
+    :rtype: tuple
+    """
+    n = len(vct_y)
+    size = int(np.ceil(n / n_buckets))
+    n_rows = int(np.ceil(n / size))
+    # pad to a (buckets, size) matrix
+    grd = np.full(n_rows * size, np.nan)
+    grd[:n] = vct_y
+    grd = grd.reshape(n_rows, size)
+    grd_nan = np.isnan(grd)
+    vct_offsets = np.arange(n_rows) * size
+    vct_min = vct_offsets + np.argmin(np.where(grd_nan, np.inf, grd), axis=1)
+    vct_max = vct_offsets + np.argmax(np.where(grd_nan, -np.inf, grd), axis=1)
+    # interleave in the original order
+    ids = np.unique(np.concatenate([vct_min, vct_max]))
+    ids = ids[ids < n]
+    ids = ids[~np.isnan(vct_y[ids])]
+    return vct_x[ids], vct_y[ids]
+
+
+def _export_table(df, file_base, fmt="csv"):
+    """Export a table to a file in a given format.
+
+    :param df: table to export
+    :type df: :class:`pandas.DataFrame`
+    :param file_base: path to output file without extension
+    :type file_base: str
+    :param fmt: file format. Options: ``csv`` (``;``-separated) and
+        ``parquet`` (requires ``pyarrow``). Default is ``csv``
+    :type fmt: str
+    :return: path to output file
+    :rtype: str
+    """
+    if fmt == "parquet":
+        file_out = "{}.parquet".format(file_base)
+        df.to_parquet(file_out, engine="pyarrow", compression="zstd", index=False)
+    elif fmt == "csv":
+        file_out = "{}.csv".format(file_base)
+        df.to_csv(file_out, sep=";", index=False)
+    else:
+        raise ValueError("fmt must be 'csv' or 'parquet'")
+    return file_out
+
+
+# last triangulation built by Raster.rebase_grid: (points, Delaunay)
+_REBASE_TRI = [None, None]
+
+# prj strings loaded by Raster.load_prj_file: {(file, mtime, size): prj}
+_PRJ_CACHE = dict()
+
+# basic stats of Raster.get_grid_stats: {grid fingerprint: stats}
+_STATS_CACHE = dict()
+_STATS_CACHE_SIZE = 32
+
+
+def _get_triangulation(grd_points):
+    """Get the Delaunay triangulation of data points, reusing the last one built.
+
+    Batch rebases (e.g. a raster series onto one base) share the same source
+    points, so the qhull triangulation is only built once.
+
+    :param grd_points: data points coordinates, shape (n, 2)
+    :type grd_points: :class:`numpy.ndarray`
+    :return: triangulation of the points
+    :rtype: :class:`scipy.spatial.Delaunay`
+    """
+    from scipy.spatial import Delaunay
+
+    if _REBASE_TRI[0] is None or not np.array_equal(_REBASE_TRI[0], grd_points):
+        _REBASE_TRI[0] = grd_points
+        _REBASE_TRI[1] = Delaunay(grd_points)
+    return _REBASE_TRI[1]
+
+
+def _get_grid_key(grid):
+    """Get a content fingerprint of a grid.
+
+    Hashing the grid bytes is much cheaper than the sorting behind percentile
+    stats, so stats of unchanged grids can be reused even after in place edits.
+
+    :param grid: data grid (masked or not)
+    :type grid: :class:`numpy.ndarray`
+    :return: shape, dtype and hash of the data (and mask, if any)
+    :rtype: tuple
+    """
+    import hashlib
+
+    _hash = hashlib.sha1(np.ascontiguousarray(np.ma.getdata(grid)))
+    if np.ma.is_masked(grid):
+        _hash.update(np.ascontiguousarray(np.ma.getmaskarray(grid)))
+    return grid.shape, grid.dtype.str, _hash.hexdigest()
+
+
 # ------------- CHRONOLOGICAL OBJECTS -------------  #
 
 class TimeSeries(DataSet):
@@ -133,6 +413,7 @@ class TimeSeries(DataSet):
         self.varalias = "Var"
         self.varname = "Variable"
         self.units = "units"
+        self.dtype = "float32"  # data type of the variable field
         self.agg = "mean"
         self.cmap = "Dark2"
         self.object_alias = "TS"
@@ -167,6 +448,15 @@ class TimeSeries(DataSet):
         self.epochs_n = None
         self.smallgaps_n = None
 
+        # memoization: data version is bumped on every data change
+        self._version = 0
+        self._std_cache = None
+        self._epochs_cache = None
+        self._indexed_cache = None
+        self._mavg_cache = None
+        self._dtnum_cache = None
+        self._buckets_cache = None
+
         # incoming data
         self.file_input = None  # todo rename
         self.file_data_dtfield = self.dtfield
@@ -240,6 +530,8 @@ class TimeSeries(DataSet):
             "xmax": None,
             "ymin": 0,
             "ymax": None,
+            "mavg_period": None,
+            "mavg_color": "black",
         }
         return None
 
@@ -264,33 +556,26 @@ class TimeSeries(DataSet):
         if self.data is None:
             pass
         else:
-            # Copy the data
-            df = self.data.copy()
-
-            # Extract components of the datetime
-            df["year"] = df[self.dtfield].dt.year
-            df["month"] = df[self.dtfield].dt.month
-            df["day"] = df[self.dtfield].dt.day
-            df["hour"] = df[self.dtfield].dt.hour
-            df["minute"] = df[self.dtfield].dt.minute
-            df["second"] = df[self.dtfield].dt.second
+            # Get the datetime accessor (no data copy)
+            dt = self.data[self.dtfield].dt
 
             # Check consistency within each unit of time
-            if df["second"].nunique() > 1:
+            # (components are extracted only when needed)
+            if dt.second.nunique() > 1:
                 self.dtfreq = "1min"
                 self.dtres = "second"
-            elif df["minute"].nunique() > 1:
+            elif dt.minute.nunique() > 1:
                 self.dtfreq = "20min"  # force to 20min
                 self.dtres = "minute"
-            elif df["hour"].nunique() > 1:
+            elif dt.hour.nunique() > 1:
                 self.dtfreq = "H"
                 self.dtres = "hour"
-            elif df["day"].nunique() > 1:
+            elif dt.day.nunique() > 1:
                 self.dtfreq = "D"
                 self.dtres = "day"
                 # force gapsize to 1 when daily+ time scale
                 self.gapsize = 1
-            elif df["month"].nunique() > 1:
+            elif dt.month.nunique() > 1:
                 self.dtfreq = "MS"
                 self.dtres = "month"
                 # force gapsize to 1 when daily+ time scale
@@ -380,6 +665,7 @@ class TimeSeries(DataSet):
         >>> ts.update()
         """
         if self.data is not None:
+            self._version += 1
             self._set_frequency()
             self.start = self.data[self.dtfield].min()
             self.end = self.data[self.dtfield].max()
@@ -471,20 +757,26 @@ class TimeSeries(DataSet):
         >>> ts.set_data(input_data, input_dtfield='Date', input_varfield='Temperature')
 
         """
-        # Get a copy of the input DataFrame
-        df = input_df.copy()
-
         # Drop NaN values if specified
+        df = input_df
         if dropnan:
             df = df.dropna()
 
-        # Rename columns to standard format
+        # Rename columns to standard format (returns a new DataFrame)
         df = df.rename(
             columns={input_dtfield: self.dtfield, input_varfield: self.varfield}
         )
 
         # Convert datetime column to standard format
-        df[self.dtfield] = pd.to_datetime(df[self.dtfield], format="%Y-%m-%d %H:%M:%S")
+        if not pd.api.types.is_datetime64_any_dtype(df[self.dtfield]):
+            # parse only unique timestamps and map them back by codes
+            cat = pd.Categorical(df[self.dtfield])
+            dt_unique = pd.to_datetime(cat.categories, format="%Y-%m-%d %H:%M:%S")
+            df[self.dtfield] = dt_unique.take(
+                cat.codes, allow_fill=True, fill_value=pd.NaT
+            )
+        # overwrite incoming dtype
+        df[self.varfield] = df[self.varfield].astype(self.dtype)
 
         if filter_dates is None:
             pass
@@ -495,7 +787,7 @@ class TimeSeries(DataSet):
                 df = df.query("{} < '{}'".format(self.dtfield, filter_dates[1]))
 
         # Set the data attribute
-        self.data = df.copy()
+        self.data = df
         # update all
         self.update()
 
@@ -565,13 +857,19 @@ class TimeSeries(DataSet):
             self.file_data_varfield = input_varfield
 
         # -------------- call loading function -------------- #
-        df = pd.read_csv(
-            file_data,
+        dict_read = dict(
             sep=in_sep,
-            dtype={input_dtfield: str, input_varfield: float},
+            dtype={input_varfield: self.dtype},
             usecols=[input_dtfield, input_varfield],
-            parse_dates=[self.file_data_dtfield]
+            parse_dates=[input_dtfield],
         )
+        try:
+            # use the multithreaded pyarrow parser if available
+            df = pd.read_csv(file_data, engine="pyarrow", **dict_read)
+        except (ImportError, ValueError):
+            df = pd.read_csv(file_data, **dict_read)
+        # keep the same datetime resolution of the default parser
+        df[input_dtfield] = df[input_dtfield].astype("datetime64[ns]")
 
         # -------------- post-loading logic -------------- #
         df = df.rename(
@@ -590,7 +888,7 @@ class TimeSeries(DataSet):
                 df = df.query("{} < '{}'".format(self.dtfield, filter_dates[1]))
 
         # Set the data attribute
-        self.data = df.copy()
+        self.data = df
 
         # ------------ update related attributes ------------ #
         self.file_data = file_data[:]
@@ -600,6 +898,32 @@ class TimeSeries(DataSet):
 
         return None
 
+    # docs: ok
+    def export(self, folder, fmt="csv"):
+        """Export data (time series and epoch stats) to csv or parquet files
+
+        :param folder: str
+            Path to output folder
+        :type folder: str
+
+        :param fmt: str, optional
+            File format. Options: ``csv`` and ``parquet`` (requires ``pyarrow``).
+            Parquet files are binary, compressed and much faster to write.
+            Default is ``csv``
+        :type fmt: str
+
+        :return: None
+        :rtype: None
+        """
+        filename = "{}_{}".format(self.varname, self.alias)
+        if self.data is not None:
+            _export_table(self.data, "{}/{}".format(folder, filename), fmt=fmt)
+        if self.epochs_stats is not None:
+            _export_table(
+                self.epochs_stats, "{}/{}_epochs".format(folder, filename), fmt=fmt
+            )
+        return None
+
     # docs: ok
     def cut_edges(self, inplace=False):
         """Cut off initial and final NaN records in a given time series.
@@ -627,36 +951,25 @@ class TimeSeries(DataSet):
         >>> trimmed_ts = ts.cut_edges(inplace=False)
         """
 
-        # get dataframe
-        in_df = self.data.copy()
-        def_len = len(in_df)
-
-        # drop first nan lines
-        drop_ids = list()
-
-        # loop to collect indexes in the start of series
-        for def_i in range(def_len): # go forward
-            aux = in_df[self.varfield].isnull().iloc[def_i]
-            if aux:
-                drop_ids.append(def_i)
-            else:
-                break
-
-        # loop to collect indexes in the end of series
-        for def_i in range(def_len - 1, -1, -1): # go backward
-            aux = in_df[self.varfield].isnull().iloc[def_i]
-            if aux:
-                drop_ids.append(def_i)
-            else:
-                break
+        # get the valid records mask
+        vct = self.data[self.varfield].to_numpy()
+        if vct.dtype.kind == "f":
+            mask = ~np.isnan(vct)
+        else:
+            mask = pd.notna(vct)
 
-        # loop to drop rows:
-        for def_i in range(len(drop_ids)):
-            in_df.drop(drop_ids[def_i], inplace=True)
+        # slice from the first to the last valid record
+        if mask.any():
+            first = int(mask.argmax())
+            last = len(mask) - int(mask[::-1].argmax())
+            in_df = self.data.iloc[first:last].reset_index(drop=True)
+        else:
+            in_df = self.data.iloc[0:0].copy()
 
         # output
         if inplace:
-            self.data = in_df.copy()
+            self.data = in_df
+            self._version += 1
             return None
         else:
             return in_df
@@ -682,7 +995,7 @@ class TimeSeries(DataSet):
         - Handles missing start and end values by using the first and last datetimes in the data.
         - Standardizes the incoming start and end datetimes to midnight of their respective days.
         - Creates a full date range with the specified frequency for the standardization period.
-        - Groups the data by epochs (based on the frequency and datetime field), applies the specified aggregation function, and fills in missing values with left merges.
+        - Groups the data by regular time steps (based on the frequency), applies the specified aggregation function, and reindexes to the full date range so that missing steps are NaN.
         - Cuts off any edges with missing data.
         - Updates internal attributes, including ``self.isstandard`` to indicate that the data has been standardized.
 
@@ -696,21 +1009,10 @@ class TimeSeries(DataSet):
 
         """
 
-        def _insert_epochs(_df, _dtfield, _freq):
-            _df["StEpoch"] = (
-                pd.cut(
-                    _df[_dtfield],
-                    bins=pd.date_range(
-                        start=_df[_dtfield].min(),
-                        end=_df[_dtfield].max(),
-                        freq=_freq,
-                    ),
-                    labels=False,
-                )
-                + 1
-            )
-            _df["StEpoch"].values[0] = 0
-            return _df
+        # Skip if data is already standardized with the same setup
+        std_key = (start, end, self.dtfreq, self.agg)
+        if self._is_cached(self._std_cache, std_key):
+            return None
 
         # Handle None values
         if start is None:
@@ -725,30 +1027,24 @@ class TimeSeries(DataSet):
 
         # Get a standard date range for all periods
         dt_index = pd.date_range(start=start, end=end, freq=self.dtfreq)
-        # Set dataframe
-        df = pd.DataFrame({self.dtfield: dt_index})
-        # Insert Epochs in standard data
-        df = _insert_epochs(_df=df, _dtfield=self.dtfield, _freq=self.dtfreq)
 
         # Get non-standard data
-        df2 = self.data.copy()
-
-        # Insert Epochs in non-standard data
-        df2 = _insert_epochs(_df=df2, _dtfield=self.dtfield, _freq=self.dtfreq)
-
-        # Group by 'Epochs' and calculate agg function
-        result_df = df2.groupby("StEpoch")[self.varfield].agg([self.agg]).reset_index()
-        # Rename
-        result_df = result_df.rename(columns={self.agg: self.varfield})
-
-        # Merge
-        df = pd.merge(
-            left=df, right=result_df, left_on="StEpoch", right_on="StEpoch", how="left"
+        sr_data = self.data.set_index(self.dtfield)[self.varfield]
+
+        # Group by regular steps and calculate agg function
+        grouped = sr_data.groupby(pd.Grouper(freq=self.dtfreq))
+        sr_agg = grouped.agg(self.agg)
+        # Clear steps without any record
+        sr_agg = sr_agg[grouped.size() > 0]
+
+        # Reindex to the standard date range
+        self.data = (
+            sr_agg.astype(self.dtype)
+            .reindex(dt_index)
+            .rename_axis(self.dtfield)
+            .reset_index()
         )
 
-        # Clear extra column
-        self.data = df.drop(columns="StEpoch").copy()
-
         # Cut off edges
         self.cut_edges(inplace=True)
 
@@ -758,8 +1054,98 @@ class TimeSeries(DataSet):
         # Update all attributes
         self.update()
 
+        # Memoize standardization
+        self._std_cache = (self.data, self._version, std_key)
+
         return None
 
+    def _is_cached(self, cache, key):
+        """Check if a cache entry is valid for the current data.
+
+        :param cache: cache entry ``(data, version, key, ...)`` or None
+        :type cache: tuple
+        :param key: setup key of the cached operation
+        :type key: tuple
+        :return: True if the cache entry is valid
+        :rtype: bool
+        """
+        if cache is None:
+            return False
+        return cache[0] is self.data and cache[1] == self._version and cache[2] == key
+
+    @property
+    def _data_indexed(self):
+        """The data indexed by datetime, memoized until the next data change.
+
+        .. warning::
+
+            The returned :class:`pandas.DataFrame` is shared. Do not modify it.
+
+        :return: data with the datetime field as index
+        :rtype: :class:`pandas.DataFrame`
+        """
+        if not self._is_cached(self._indexed_cache, ()):
+            df = self.data.set_index(self.dtfield)
+            self._indexed_cache = (self.data, self._version, (), df)
+        return self._indexed_cache[3]
+
+    def _get_buckets(self, freq):
+        """Get the time window (bucket) ids of records, memoized by frequency.
+
+        :param freq: Pandas-like alias frequency (e.g., ``D``, ``MS``, ``YS``)
+        :type freq: str
+        :return: bucket ids of records and the datetime index of buckets
+        :rtype: tuple
+        """
+        if not self._is_cached(self._buckets_cache, (freq,)):
+            ids, dt_index = _get_buckets(self._data_indexed.index.to_numpy(), freq)
+            self._buckets_cache = (self.data, self._version, (freq,), ids, dt_index)
+        return self._buckets_cache[3], self._buckets_cache[4]
+
+    def get_moving_average(self, period):
+        """Get the moving average of the variable, memoized until the next data change.
+
+        :param period: number of records in the moving window
+        :type period: int
+        :return: moving average of records (NaN where fewer than 2 valid records)
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self.get_moving_stat(period=period, stat="mean")
+
+    def get_moving_stat(self, period, stat="mean"):
+        """Get a moving window statistic of the variable, memoized until the next data change.
+
+        :param period: number of records in the moving window
+        :type period: int
+        :param stat: statistic. Options: ``mean``, ``sum``, ``std``, ``min``, ``max`` and ``median``.
+            Default is ``mean``
+        :type stat: str
+        :return: moving statistic of records (NaN where fewer than 2 valid records)
+        :rtype: :class:`numpy.ndarray`
+        """
+        if not self._is_cached(self._mavg_cache, (period, stat)):
+            vct_mstat = _moving_stat(
+                self.data[self.varfield].to_numpy(),
+                window=period,
+                stat=stat,
+                min_periods=2,
+            )
+            self._mavg_cache = (self.data, self._version, (period, stat), vct_mstat)
+        return self._mavg_cache[3]
+
+    def _get_date_numbers(self):
+        """Get the datetimes as matplotlib date numbers, memoized until the next data change.
+
+        :return: matplotlib date numbers of records
+        :rtype: :class:`numpy.ndarray`
+        """
+        import matplotlib.dates as mdates
+
+        if not self._is_cached(self._dtnum_cache, ()):
+            vct_dtnum = mdates.date2num(self.data[self.dtfield].to_numpy())
+            self._dtnum_cache = (self.data, self._version, (), vct_dtnum)
+        return self._dtnum_cache[3]
+
     def clear_outliers(self, inplace=False):
         # todo docstring
         # copy local data
@@ -777,6 +1163,7 @@ class TimeSeries(DataSet):
         if inplace:
             # overwrite local data
             self.data[self.varfield] = vct
+            self._version += 1
             return None
         else:
             return df
@@ -800,49 +1187,21 @@ class TimeSeries(DataSet):
 
         >>> df_epochs = ts.get_epochs()
         """
-        df = self.data.copy()
-        # Create a helper column to label continuous chunks of data
-        df["CumSum"] = (
-            df[self.varfield]
-            .isna()
-            .astype(int)
-            .groupby(df[self.varfield].notna().cumsum())
-            .cumsum()
-        )
-
-        # get skip hint
-        skip_v = np.zeros(len(df))
-        for i in range(len(df) - 1):
-            n_curr = df["CumSum"].values[i]
-            n_next = df["CumSum"].values[i + 1]
-            if n_next < n_curr:
-                if n_curr >= self.gapsize:
-                    n_start = i - n_curr
-                    if i <= n_curr:
-                        n_start = 0
-                    skip_v[n_start + 1: i + 1] = 1
-        df["Skip"] = skip_v
-
-        # Set Epoch Field
-        df[self.epochs_id_field] = 0
-        # counter epochs
-        counter = 1
-        for i in range(len(df) - 1):
-            if df["Skip"].values[i] == 0:
-                df[self.epochs_id_field].values[i] = counter
-            else:
-                if df["Skip"].values[i + 1] == 0:
-                    counter = counter + 1
-        if df["Skip"].values[i + 1] == 0:
-            df[self.epochs_id_field].values[i] = counter
-
-        df = df.drop(columns=["CumSum", "Skip"])
+        # Get Epoch Field (memoized by data version and gap size)
+        if self._is_cached(self._epochs_cache, (self.gapsize,)):
+            vct_epochs = self._epochs_cache[3]
+        else:
+            vct_epochs = _label_epochs(
+                self.data[self.varfield].isna().to_numpy(), self.gapsize
+            )
+            self._epochs_cache = (self.data, self._version, (self.gapsize,), vct_epochs)
 
         if inplace:
-            self.data = df.copy()
+            self.data[self.epochs_id_field] = vct_epochs
             return None
         else:
-            return df
+            # assign returns a new DataFrame
+            return self.data.assign(**{self.epochs_id_field: vct_epochs})
 
     def update_epochs_stats(self):
         """Update all epochs statistics.
@@ -947,7 +1306,7 @@ class TimeSeries(DataSet):
 
         **Notes:**
 
-        - The interpolation is performed for each unique epoch in the time series.
+        - The interpolation is performed once over the valid records and then cleared in large gaps (epoch 0).
         - The ``method`` parameter determines the interpolation technique. Common options include ``constant``, ``linear``, ``nearest``, ``zero``, ``slinear``, ``quadratic``, and ``cubic`. See the documentation of scipy.interpolate.interp1d for additional methods and details.
         - If ``linear`` is chosen, the interpolation is a linear interpolation. For ``nearest``, it uses the value of the nearest data point. ``zero`` uses zero-order interpolation (nearest-neighbor). ``slinear`` and ``quadratic`` are spline interpolations of first and second order, respectively. ``cubic`` is a cubic spline interpolation.
         - If the method is ``linear``, the fill_value parameter is set to ``extrapolate`` to allow extrapolation beyond the data range.
@@ -967,49 +1326,42 @@ class TimeSeries(DataSet):
             self.standardize()
 
         # Get epochs for interpolation
-        df = self.get_epochs(inplace=False)
-        epochs = df["Epoch_Id"].unique()
-        list_dfs = list()
+        df_new = self.get_epochs(inplace=False)
+        x = df_new[self.dtfield].astype(np.int64).to_numpy()
+        y = df_new[self.varfield].to_numpy(dtype=np.float64)
+        mask = ~np.isnan(y)
+
+        if method == "constant":
+            vct_interp = np.where(mask, y, constant)
+        elif not mask.any():
+            vct_interp = np.full(len(y), np.nan)
+        elif method == "linear":
+            vct_interp = np.interp(x, x[mask], y[mask])
+        else:  # use scipy methods
+            # Create a single interpolation function for the whole series
+            interpolation_func = interp1d(
+                x[mask],
+                y[mask],
+                kind=method,
+                fill_value="extrapolate",
+                assume_sorted=True,
+            )
+            # Interpolate full values
+            vct_interp = interpolation_func(x)
 
-        for epoch in epochs:
-            df_aux1 = df.query("Epoch_Id == {}".format(epoch)).copy()
-            if epoch == 0:
-                df_aux1["{}_interp".format(self.varfield)] = np.nan
-            else:
-                if method == "constant":
-                    df_aux1["{}_interp".format(self.varfield)] = np.where(
-                        df_aux1[self.varfield].isna(),
-                        constant,
-                        df_aux1[self.varfield].values,
-                    )
-                else:  # use scipy methods
-                    # clear from nan values
-                    df_aux2 = df_aux1.dropna().copy()
-                    # Create an interpolation function
-                    interpolation_func = interp1d(
-                        df_aux2[self.dtfield].astype(np.int64).values,
-                        df_aux2[self.varfield].values,
-                        kind=method,
-                        fill_value="extrapolate",
-                    )
-                    # Interpolate full values
-                    df_aux1["{}_interp".format(self.varfield)] = interpolation_func(
-                        df_aux1[self.dtfield].astype(np.int64)
-                    )
-            # Append
-            list_dfs.append(df_aux1)
-        df_new = pd.concat(list_dfs, ignore_index=True)
-        df_new = df_new.sort_values(by=self.dtfield).reset_index(drop=True)
+        # Clear large gaps (epoch 0)
+        vct_interp[df_new[self.epochs_id_field].to_numpy() == 0] = np.nan
+        df_new["{}_interp".format(self.varfield)] = vct_interp
 
         if inplace:
-            self.data[self.varfield] = df_new["{}_interp".format(self.varfield)].values
+            self.data[self.varfield] = df_new["{}_interp".format(self.varfield)].values.astype(self.dtype)
             self.update()
             return None
         else:
             return df_new
 
     # docs: ok
-    def aggregate(self, freq, bad_max, agg_funcs=None):
+    def aggregate(self, freq, bad_max, agg_funcs=None, percentiles=None):
         """ "Aggregate the time series data based on a specified frequency using various aggregation functions.
 
         :param freq: str
@@ -1032,9 +1384,14 @@ class TimeSeries(DataSet):
 
         :param agg_funcs: dict, optional
             A dictionary specifying customized aggregation functions for each variable.
-            Default is None, which uses standard aggregation functions (sum, mean, median, min, max, std, var, percentiles).
+            Default is None, which uses standard aggregation functions (sum, mean, median, min, max, std, var).
         :type agg_funcs: dict
 
+        :param percentiles: list, optional
+            List of percentiles to compute in a single pass for each time window
+            (example: ``[5, 25, 75, 95]``). Default is None (no percentiles).
+        :type percentiles: list
+
         :return: :class:`pandas.DataFrame`
             A new :class:`pandas.DataFrame` with aggregated values based on the specified frequency.
         :rtype: :class:`pandas.DataFrame`
@@ -1043,6 +1400,7 @@ class TimeSeries(DataSet):
 
         - Resamples the time series data to the specified frequency using Pandas-like alias strings.
         - Aggregates the values using the specified aggregation functions.
+        - Computes all percentiles of a time window at once, in fields named like ``{varfield}_p90``.
         - Counts the number of ``Bad`` records in each time window and excludes time windows with more ``Bad`` entries
           than the specified threshold.
 
@@ -1063,56 +1421,124 @@ class TimeSeries(DataSet):
                 "std": "std",
                 "var": "var",
             }
-            '''
-            # Add custom percentiles to the dictionary
-            percentiles_to_compute = [1, 5, 10, 25, 50, 75, 90, 95, 99]
-            for p in percentiles_to_compute:
-                agg_funcs[f"p{p}"] = lambda x, p=p: np.percentile(x, p)
-            '''
 
-        # set list of tuples
-        agg_funcs_list = [
-            ("{}_{}".format(self.varfield, f), agg_funcs[f]) for f in agg_funcs
-        ]
+        # set named aggregations, including the count of bad records
+        dct_named_aggs = {
+            "{}_{}".format(self.varfield, f): pd.NamedAgg(
+                column=self.varfield, aggfunc=agg_funcs[f]
+            )
+            for f in agg_funcs
+        }
+        dct_named_aggs["_n_size"] = pd.NamedAgg(column=self.varfield, aggfunc="size")
+        dct_named_aggs["_n_valid"] = pd.NamedAgg(column=self.varfield, aggfunc="count")
 
-        # get data
-        df = self.data.copy()
-        df["Bad"] = df[self.varfield].isna().astype(int)
-        # Set the 'datetime' column as the index
-        df.set_index(self.dtfield, inplace=True)
+        # get data: the memoized data indexed by datetime (shared, read only)
+        df = self._data_indexed
 
-        # Resample the time series to a frequency using aggregation functions
-        agg_df1 = df.resample(freq)[self.varfield].agg(agg_funcs_list)
-        agg_df2 = df.resample(freq)["Bad"].agg([("Bad_count", "sum")])
+        # Resample the time series to a frequency in a single pass
+        agg_df = df.resample(freq).agg(**dct_named_aggs)
+        # bad records are the missing ones
+        agg_df["Bad_count"] = agg_df.pop("_n_size") - agg_df.pop("_n_valid")
 
-        # Reset the index to get 'DateTime' as a regular column
-        agg_df1.reset_index(inplace=True)
-        agg_df2.reset_index(inplace=True)
+        # Compute all percentiles at once for each time window
+        if percentiles is not None and len(percentiles) > 0:
+            lst_pct_fields = [
+                "{}_p{}".format(self.varfield, p) for p in percentiles
+            ]
 
-        # merge with bad dates
-        agg_df = pd.merge(left=agg_df1, right=agg_df2, how="left", on=self.dtfield)
+            # get bucket ids of records
+            ids, dt_index = self._get_buckets(freq)
+            # sort records by bucket
+            order = np.argsort(ids, kind="stable")
+            ids = ids[order]
+            vct = df[self.varfield].to_numpy(dtype=self.dtype)[order]
+
+            # scatter values into a padded (buckets, max size) matrix
+            sizes = np.bincount(ids, minlength=len(dt_index))
+            offsets = np.cumsum(sizes) - sizes
+            positions = np.arange(len(ids)) - offsets[ids]
+            grd = np.full(
+                (len(dt_index), max(sizes.max(initial=0), 1)), np.nan, dtype=self.dtype
+            )
+            grd[ids, positions] = vct
+
+            # compute all percentiles of all buckets at once
+            with warnings.catch_warnings():
+                # all-NaN buckets yield NaN
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                grd_pct = np.nanpercentile(grd, percentiles, axis=1)
+            # keep the dtype of the variable field, as the other fields
+            grd_pct = grd_pct.astype(self.dtype, copy=False)
+
+            agg_df_pct = pd.DataFrame(
+                grd_pct.T, index=dt_index, columns=lst_pct_fields
+            )
+            agg_df = agg_df.join(agg_df_pct)
 
-        # set new df
-        agg_df_new = pd.DataFrame(
-            {
-                self.dtfield: pd.date_range(
-                    start=agg_df[self.dtfield].values[0],
-                    end=agg_df[self.dtfield].values[-1],
-                    freq=freq,
-                )
-            }
+        # conform to the full date range
+        agg_df = agg_df.reindex(
+            pd.date_range(start=agg_df.index[0], end=agg_df.index[-1], freq=freq)
         )
-        # remove bad records
-        agg_df.drop(agg_df[agg_df["Bad_count"] > bad_max].index, inplace=True)
+        # mask bad records
+        agg_df.loc[agg_df["Bad_count"] > bad_max] = np.nan
         # remove bad column
-        agg_df.drop(columns=["Bad_count"], inplace=True)
+        agg_df = agg_df.drop(columns=["Bad_count"])
 
-        # left join
-        agg_df_new = pd.merge(
-            left=agg_df_new, right=agg_df, on=self.dtfield, how="left"
+        # Reset the index to get 'DateTime' as a regular column
+        agg_df = agg_df.rename_axis(self.dtfield).reset_index()
+
+        return agg_df
+
+    def _resample(self, freq, how):
+        """Resample the time series with a grouped reduction kernel.
+
+        :param freq: Pandas-like alias frequency (e.g., ``D``, ``MS``, ``YS``)
+        :type freq: str
+        :param how: reduction. Options: ``sum`` and ``mean``
+        :type how: str
+        :return: resampled data
+        :rtype: :class:`pandas.DataFrame`
+        """
+        # get memoized bucket ids
+        ids, dt_index = self._get_buckets(freq)
+        # reduce
+        vct = _group_reduce(
+            vct=self.data[self.varfield].to_numpy(dtype=np.float64),
+            ids=ids,
+            size=len(dt_index),
+            how=how,
+        )
+        return pd.DataFrame(
+            {self.dtfield: dt_index, self.varfield: vct.astype(self.dtype)}
         )
 
-        return agg_df_new
+    def resample_sum(self, freq):
+        """Resample the time series by summing values in each time window.
+
+        :param freq: Pandas-like alias frequency (e.g., ``D``, ``MS``, ``YS``)
+        :type freq: str
+        :return: resampled data (NaN in windows without valid records)
+        :rtype: :class:`pandas.DataFrame`
+
+        **Examples:**
+
+        >>> df_monthly = ts.resample_sum(freq="MS")
+        """
+        return self._resample(freq=freq, how="sum")
+
+    def resample_mean(self, freq):
+        """Resample the time series by averaging values in each time window.
+
+        :param freq: Pandas-like alias frequency (e.g., ``D``, ``MS``, ``YS``)
+        :type freq: str
+        :return: resampled data (NaN in windows without valid records)
+        :rtype: :class:`pandas.DataFrame`
+
+        **Examples:**
+
+        >>> df_monthly = ts.resample_mean(freq="MS")
+        """
+        return self._resample(freq=freq, how="mean")
 
     def upscale(self, freq, bad_max, inplace=True):
         # todo docstring
@@ -1123,6 +1549,7 @@ class TimeSeries(DataSet):
         if inplace:
             # overwrite local data
             self.data = df_upscale
+            self._version += 1
             #
             self._set_frequency()
 
@@ -1202,17 +1629,20 @@ class TimeSeries(DataSet):
         # --------------------- plotting --------------------- #
         gaps_c = "tab:red"
         gaps_a = 0.6
-        # plot loop
-        for i in range(len(self.epochs_stats)):
-            start = self.epochs_stats["Start"].values[i]
-            end = self.epochs_stats["End"].values[i]
-            df_aux = self.data.query(
-                "{} >= '{}' and {} < '{}'".format(
-                    self.dtfield, start, self.dtfield, end
-                )
+        # get epochs colors
+        dict_colors = dict(
+            zip(
+                self.epochs_stats[self.epochs_id_field].values,
+                self.epochs_stats[self.color_field].values,
             )
-            epoch_c = self.epochs_stats["Color"].values[i]
-            epoch_id = self.epochs_stats["Epoch_Id"].values[i]
+        )
+        # plot loop: split data by epochs in a single pass
+        df_epochs = self.get_epochs(inplace=False)
+        for epoch_id, df_aux in df_epochs.groupby(self.epochs_id_field, sort=True):
+            # skip gap epoch (0) and epochs without stats
+            if epoch_id not in dict_colors:
+                continue
+            epoch_c = dict_colors[epoch_id]
             plt.plot(
                 df_aux[self.dtfield],
                 df_aux[self.varfield],
@@ -1293,6 +1723,8 @@ class TimeSeries(DataSet):
         >>> ds.view(show=False)
 
         """
+        import matplotlib.dates as mdates
+
         # get specs
         specs = self.view_specs.copy()
 
@@ -1309,13 +1741,39 @@ class TimeSeries(DataSet):
         if specs["ymax"] is None:
             specs["ymax"] = self.data[specs["yvar"]].max()
 
+        # plot datetimes as plain date numbers (skips the unit conversion)
+        is_dt = specs["xvar"] == self.dtfield
+        if is_dt:
+            vct_x = self._get_date_numbers()
+            specs["xmin"] = mdates.date2num(pd.Timestamp(specs["xmin"]))
+            specs["xmax"] = mdates.date2num(pd.Timestamp(specs["xmax"]))
+        else:
+            vct_x = self.data[specs["xvar"]].to_numpy()
+
+        # decimate large series to about the figure width in pixels
+        n_px = int(specs["width"] * specs["dpi"])
+        decimate = len(vct_x) > 4 * n_px
+
         # --------------------- plotting --------------------- #
+        # data artists are rasterized (at the figure dpi), axes and text stay vector
+        vct_y = self.data[specs["yvar"]].to_numpy(dtype=np.float64)
+        if decimate:
+            vct_x_plot, vct_y_plot = _decimate_minmax(vct_x, vct_y, n_px)
+        else:
+            vct_x_plot, vct_y_plot = vct_x, vct_y
         plt.plot(
-            self.data[specs["xvar"]],
-            self.data[specs["yvar"]],
-            ".",
-            color=specs["color"]
+            vct_x_plot, vct_y_plot, ".", color=specs["color"], rasterized=True, snap=False
         )
+        # moving average line
+        if specs["mavg_period"] is not None and specs["yvar"] == self.varfield:
+            vct_mavg = self.get_moving_average(period=specs["mavg_period"])
+            if decimate:
+                vct_x_plot, vct_mavg = _decimate_minmax(vct_x, vct_mavg, n_px)
+            else:
+                vct_x_plot = vct_x
+            plt.plot(
+                vct_x_plot, vct_mavg, color=specs["mavg_color"], rasterized=True, snap=False
+            )
 
         # --------------------- post-plotting --------------------- #
         # set basic plotting stuff
@@ -1324,6 +1782,13 @@ class TimeSeries(DataSet):
         plt.xlabel(specs["xlabel"])
         plt.xlim(specs["xmin"], specs["xmax"])
         plt.ylim(specs["ymin"], 1.2 * specs["ymax"])
+        if is_dt:
+            # format date numbers as dates
+            ax = plt.gca()
+            ax.xaxis_date()
+            locator = mdates.AutoDateLocator()
+            ax.xaxis.set_major_locator(locator)
+            ax.xaxis.set_major_formatter(mdates.AutoDateFormatter(locator))
 
         # Adjust layout to prevent cutoff
         plt.tight_layout()
@@ -3157,17 +3622,17 @@ class TimeSeriesCollection(Collection):
         return None
 
     # docs todo
-    def export_data(self, folder, filename=None, merged=True):
+    def export_data(self, folder, filename=None, merged=True, fmt="csv"):
         if filename is None:
             filename = self.name
         if merged:
             df = self.get_epochs()
-            df.to_csv("{}/{}.csv".format(folder, filename), sep=";", index=False)
+            _export_table(df, "{}/{}".format(folder, filename), fmt=fmt)
             df = self.merge_local_epochs()
-            df.to_csv("{}/{}_epochs.csv".format(folder, filename), sep=";", index=False)
+            _export_table(df, "{}/{}_epochs".format(folder, filename), fmt=fmt)
         else:
             for name in self.collection:
-                df = self.collection[name].export(folder=folder)
+                df = self.collection[name].export(folder=folder, fmt=fmt)
 
 class TimeSeriesCluster(TimeSeriesCollection):
     # todo docstring
@@ -3462,7 +3927,7 @@ class Raster:
         **Attributes:**
 
         - ``grid`` (None): Main grid of the raster.
-        - ``backup_grid`` (None): Backup grid for AOI operations.
+        - ``backup_grid`` (None): Backup of grid cells overwritten by AOI operations.
         - ``isaoi`` (False): Flag indicating whether an AOI mask is applied.
         - ``asc_metadata`` (dict): Metadata dictionary with keys: ncols, nrows, xllcorner, yllcorner, cellsize, NODATA_value.
         - ``nodatavalue`` (None): NODATA value from asc_metadata.
@@ -3504,6 +3969,7 @@ class Raster:
         }
         self.nodatavalue = self.asc_metadata["NODATA_value"]
         self.cellsize = self.asc_metadata["cellsize"]
+        self._bbox = None  # bounding box cache
         self.name = name
         self.dtype = dtype
         self.cmap = "jet"
@@ -3530,7 +3996,7 @@ class Raster:
             lst_.append("\t{}: {}".format(k, dct_meta[k]))
         return "\n".join(lst_)
 
-    def set_grid(self, grid):
+    def set_grid(self, grid, copy=True):
         """Set the data grid for the raster object.
 
         This function allows setting the data grid for the raster object. The incoming grid should be a NumPy array.
@@ -3539,9 +4005,15 @@ class Raster:
             The data grid to be set for the raster.
         :type grid: :class:`numpy.ndarray`
 
+        :param copy: bool, optional
+            If False, the incoming grid is used as is when it already has the raster dtype
+            and C order (it is then modified by nodata masking). Default is True.
+        :type copy: bool
+
         **Notes:**
 
         - The function overwrites the existing data grid in the raster object with the incoming grid, ensuring that the data type matches the raster's dtype.
+        - The grid is stored as a C-contiguous array (strided views are compacted).
         - Nodata values are masked after setting the grid.
 
         **Examples:**
@@ -3550,8 +4022,8 @@ class Raster:
         >>> new_grid = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
         >>> raster.set_grid(new_grid)
         """
-        # overwrite incoming dtype
-        self.grid = grid.astype(self.dtype)
+        # overwrite incoming dtype and layout (no copy if allowed and not needed)
+        self.grid = grid.astype(self.dtype, order="C", copy=copy)
         # mask nodata values
         self.mask_nodata()
         return None
@@ -3594,6 +4066,8 @@ class Raster:
         # update nodata value and cellsize
         self.nodatavalue = self.asc_metadata["NODATA_value"]
         self.cellsize = self.asc_metadata["cellsize"]
+        # reset bounding box cache
+        self._bbox = None
         return None
 
     def load(self, asc_file, prj_file=None):
@@ -3636,6 +4110,61 @@ class Raster:
             self.load_prj_file(file=prj_file)
         return None
 
+    @classmethod
+    def _load_one(cls, asc_file, **kwargs):
+        """Load a single raster object from a ``.asc`` file (worker of ``load_many``).
+
+        :param asc_file: str
+            The path to the ``.asc`` raster file.
+        :type asc_file: str
+
+        :return: :class:`datasets.Raster`
+            The loaded raster object, named after the file.
+        :rtype: :class:`datasets.Raster`
+        """
+        raster = cls(name=os.path.basename(asc_file).split(".")[0], **kwargs)
+        Raster.load(raster, asc_file=asc_file)
+        return raster
+
+    @classmethod
+    def load_many(cls, asc_files, workers=None, **kwargs):
+        """Load many raster objects from ``.asc`` files in parallel processes.
+
+        :param asc_files: list
+            The paths to the ``.asc`` raster files. A '.prj' file with the same path and name is also loaded if it exists.
+        :type asc_files: list
+
+        :param workers: int, optional
+            Number of worker processes. If None, the number of CPUs is used. Default is None.
+        :type workers: int
+
+        :param kwargs: dict
+            Other keyword arguments passed to the raster constructor (e.g. ``dtype``).
+        :type kwargs: dict
+
+        :return: list
+            The loaded raster objects, in the same order as ``asc_files``.
+        :rtype: list
+
+        **Notes:**
+
+        - Parsing ``.asc`` files is CPU-bound and each file is independent, so files are parsed in a process pool.
+        - Rasters are named after their file names.
+
+        **Examples:**
+
+        >>> # Example of loading many tiles at once
+        >>> lst_rasters = Raster.load_many(asc_files=["path/to/tile_1.asc", "path/to/tile_2.asc"])
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from functools import partial
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            lst_rasters = list(
+                executor.map(partial(cls._load_one, **kwargs), asc_files)
+            )
+        return lst_rasters
+
     def load_tif_raster(self, file):
         """Load data from '.tif' raster files.
 
@@ -3650,7 +4179,9 @@ class Raster:
 
         **Notes:**
 
-        - The function uses the Pillow (PIL) library to open the '.tif' file and converts it to a NumPy array.
+        - If ``tifffile`` is available and the image is not compressed, the file is memory-mapped so the OS pages it in on demand.
+        - The memory map is copy-on-write: changes to the grid are never written back to the '.tif' file. Use ``grid.copy()`` to detach it from the file.
+        - Otherwise, the function uses the Pillow (PIL) library to open the '.tif' file and converts it to a NumPy array.
         - Metadata may need to be provided separately, as this function focuses on loading raster data.
         - The loaded data grid is set using the ``set_grid`` method of the raster object.
 
@@ -3659,17 +4190,24 @@ class Raster:
         >>> # Example of loading data from a '.tif' file
         >>> raster.load_tif_raster(file="path/to/raster.tif")
         """
-        from PIL import Image
-
-        # Open the TIF file
-        img_data = Image.open(file)
-        # Convert the PIL image to a NumPy array
-        grd_data = np.array(img_data)
-        # set grid
-        self.set_grid(grid=grd_data)
+        try:
+            import tifffile
+
+            # memory-map the TIF file (copy-on-write)
+            grd_data = tifffile.memmap(file, mode="c")
+        except (ImportError, ValueError):
+            # not available or not memory-mappable (e.g. compressed)
+            from PIL import Image
+
+            # Open the TIF file
+            img_data = Image.open(file)
+            # View the PIL image as a NumPy array (read-only)
+            grd_data = np.asarray(img_data)
+        # set grid (copy only if the array cannot be written)
+        self.set_grid(grid=grd_data, copy=not grd_data.flags.writeable)
         return None
 
-    def load_asc_raster(self, file):
+    def load_asc_raster(self, file, memmap_file=None, npy_cache=False):
         """Load data and metadata from ``.asc`` raster files.
 
         This function loads both data and metadata from ``.asc`` raster files into the raster object.
@@ -3678,6 +4216,17 @@ class Raster:
             The file path to the ``.asc`` raster file.
         :type file: str
 
+        :param memmap_file: str, optional
+            Path to a binary file to back the grid as a :class:`numpy.memmap` (out-of-core).
+            If None, the grid is held in memory. Default is None.
+        :type memmap_file: str
+
+        :param npy_cache: bool, optional
+            If True, the parsed grid is saved to a ``<file>.npy`` side-car file, and later loads
+            memory-map it instead of parsing the ``.asc`` file again (while it is newer than the ``.asc`` file).
+            Default is False.
+        :type npy_cache: bool
+
         :return: None
         :rtype: None
 
@@ -3688,6 +4237,7 @@ class Raster:
         - The data grid is constructed from the array information provided in the ``.asc`` file.
         - The function depends on the existence of a properly formatted ``.asc`` file.
         - No additional dependencies beyond standard Python libraries are required.
+        - A grid loaded from the ``.npy`` cache is a copy-on-write :class:`numpy.memmap`: changes are not written to the cache file.
 
         **Examples:**
 
@@ -3696,40 +4246,60 @@ class Raster:
         """
         # get file
         self.path_ascfile = file
-        f_file = open(file)
-        lst_file = f_file.readlines()
-        f_file.close()
-        #
-        # get metadata constructor loop
-        tpl_meta_labels = (
-            "ncols",
-            "nrows",
-            "xllcorner",
-            "yllcorner",
-            "cellsize",
-            "NODATA_value",
-        )
-        tpl_meta_format = ("int", "int", "float", "float", "float", "float")
-        dct_meta = dict()
-        for i in range(6):
-            lcl_lst = lst_file[i].split(" ")
-            lcl_meta_str = lcl_lst[len(lcl_lst) - 1].split("\n")[0]
-            if tpl_meta_format[i] == "int":
-                dct_meta[tpl_meta_labels[i]] = int(lcl_meta_str)
+        file_npy = file + ".npy"
+        if (
+            npy_cache
+            and os.path.isfile(file_npy)
+            and os.path.getmtime(file_npy) >= os.path.getmtime(file)
+        ):
+            # skip parsing: memory-map the cached grid (copy-on-write)
+            self.load_asc_metadata(file=file)
+            self.set_grid(grid=np.load(file_npy, mmap_mode="c"), copy=False)
+            return None
+        with open(file) as f_file:
+            # the first 6 lines are metadata
+            lst_meta = list(itertools.islice(f_file, 6))
+            #
+            # get metadata constructor loop
+            tpl_meta_labels = (
+                "ncols",
+                "nrows",
+                "xllcorner",
+                "yllcorner",
+                "cellsize",
+                "NODATA_value",
+            )
+            tpl_meta_format = ("int", "int", "float", "float", "float", "float")
+            dct_meta = dict()
+            for i in range(6):
+                lcl_meta_str = lst_meta[i].split()[-1]
+                if tpl_meta_format[i] == "int":
+                    dct_meta[tpl_meta_labels[i]] = int(lcl_meta_str)
+                else:
+                    dct_meta[tpl_meta_labels[i]] = float(lcl_meta_str)
+            #
+            # parse the remaining lines as the data grid
+            if memmap_file is None:
+                grd_data = np.loadtxt(f_file, dtype=self.dtype, ndmin=2)
             else:
-                dct_meta[tpl_meta_labels[i]] = float(lcl_meta_str)
-        #
-        # array constructor loop:
-        lst_grid = list()
-        for i in range(6, len(lst_file)):
-            lcl_lst = lst_file[i].split(" ")[1:]
-            lcl_lst[len(lcl_lst) - 1] = lcl_lst[len(lcl_lst) - 1].split("\n")[0]
-            lst_grid.append(lcl_lst)
-        # create grid file
-        grd_data = np.array(lst_grid, dtype=self.dtype)
+                tpl_shape = (dct_meta["nrows"], dct_meta["ncols"])
+                grd_data = np.memmap(
+                    memmap_file, dtype=self.dtype, mode="w+", shape=tpl_shape
+                )
+                # parse by blocks of rows so the grid is never fully in memory
+                n_block = 1000
+                for i in range(0, tpl_shape[0], n_block):
+                    lcl_rows = itertools.islice(f_file, n_block)
+                    grd_data[i : i + n_block] = np.loadtxt(
+                        lcl_rows, dtype=self.dtype, ndmin=2
+                    )
         #
+        if npy_cache:
+            # save the parsed grid before any nodata masking
+            np.save(file_npy, grd_data)
         self.set_asc_metadata(metadata=dct_meta)
-        self.set_grid(grid=grd_data)
+        # the grid already has the raster dtype: no copy
+        self.set_grid(grid=grd_data, copy=False)
         return None
 
     def load_asc_metadata(self, file):
@@ -3756,14 +4326,11 @@ class Raster:
         >>> # Example of loading metadata from a ``.asc`` file
         >>> raster.load_asc_metadata(file="path/to/raster.asc")
         """
+        # the 6 header lines fit in a single bounded read
         with open(file) as f:
-            def_lst = []
-            for i, line in enumerate(f):
-                if i >= 6:
-                    break
-                def_lst.append(line.strip())  # append each line to the list
+            def_lst = f.read(1024).splitlines()[:6]
         #
-        # get metadata constructor loop
+        # get metadata constructor
         meta_lbls = (
             "ncols",
             "nrows",
@@ -3772,15 +4339,11 @@ class Raster:
             "cellsize",
             "NODATA_value",
         )
-        meta_format = ("int", "int", "float", "float", "float", "float")
-        meta_dct = dict()
-        for i in range(6):
-            lcl_lst = def_lst[i].split(" ")
-            lcl_meta_str = lcl_lst[len(lcl_lst) - 1].split("\n")[0]
-            if meta_format[i] == "int":
-                meta_dct[meta_lbls[i]] = int(lcl_meta_str)
-            else:
-                meta_dct[meta_lbls[i]] = float(lcl_meta_str)
+        meta_format = (int, int, float, float, float, float)
+        meta_dct = {
+            lbl: fmt(line.split()[-1])
+            for lbl, fmt, line in zip(meta_lbls, meta_format, def_lst)
+        }
         # set attribute
         self.set_asc_metadata(metadata=meta_dct)
         return None
@@ -3809,8 +4372,12 @@ class Raster:
         >>> raster.load_prj_file(file="path/to/raster.prj")
         """
         self.path_prjfile = file
-        with open(file) as f:
-            self.prj = f.readline().strip("\n")
+        # identical prj files share one string (no re-reading)
+        tpl_key = (file, os.path.getmtime(file), os.path.getsize(file))
+        if tpl_key not in _PRJ_CACHE:
+            with open(file) as f:
+                _PRJ_CACHE[tpl_key] = f.readline().strip("\n")
+        self.prj = _PRJ_CACHE[tpl_key]
         return None
 
     def copy_structure(self, raster_ref, n_nodatavalue=None):
@@ -3847,7 +4414,8 @@ class Raster:
         else:
             dict_meta["NODATA_value"] = n_nodatavalue
         self.set_asc_metadata(metadata=dict_meta)
-        self.prj = raster_ref.prj[:]
+        # strings are immutable: no copy needed
+        self.prj = raster_ref.prj
         return None
 
     def export(self, folder, filename=None):
@@ -3933,30 +4501,26 @@ class Raster:
                 exp_lst.append(line)
 
             # ----------------------------------
-            # data constructor loop:
-            self.insert_nodata()  # insert nodatavalue
-
-            def_array = np.array(self.grid, dtype=self.dtype)
-            for i in range(len(def_array)):
-                # replace np.nan to no data values
-                lcl_row_sum = np.sum((np.isnan(def_array[i])) * 1)
-                if lcl_row_sum > 0:
-                    # print('Yeas')
-                    for j in range(len(def_array[i])):
-                        if np.isnan(def_array[i][j]):
-                            def_array[i][j] = int(ndv)
-                str_join = " " + " ".join(np.array(def_array[i], dtype="str")) + "\n"
-                exp_lst.append(str_join)
+            # data constructor (nodatavalue in masked cells):
+            def_array = np.asarray(self._get_filled_grid(), dtype=self.dtype)
+            if def_array.dtype.kind in ["i", "u"]:
+                s_fmt = "%d"
+            else:
+                # replace np.nan to no data values (copy only if needed)
+                grd_nan = np.isnan(def_array)
+                if grd_nan.any():
+                    def_array = np.where(grd_nan, int(ndv), def_array)
+                # enough significant digits to round-trip the dtype
+                s_fmt = "%.{}g".format(np.finfo(def_array.dtype).precision + 3)
+            # rows are written with a leading blank
+            s_row_fmt = " " + " ".join([s_fmt] * def_array.shape[1])
 
             if filename is None:
                 filename = self.name
             flenm = folder + "/" + filename + ".asc"
-            fle = open(flenm, "w+")
-            fle.writelines(exp_lst)
-            fle.close()
-
-            # mask again
-            self.mask_nodata()
+            with open(flenm, "w+") as fle:
+                fle.write("".join(exp_lst))
+                np.savetxt(fle, def_array, fmt=s_row_fmt)
 
             return flenm
 
@@ -4016,11 +4580,13 @@ class Raster:
             pass
         else:
             if self.grid.dtype.kind in ["i", "u"]:
-                # for integer grid
-                self.grid = np.ma.masked_where(self.grid == self.nodatavalue, self.grid)
+                # for integer grid (mask only, the data is not copied)
+                self.grid = np.ma.masked_where(
+                    self.grid == self.nodatavalue, self.grid, copy=False
+                )
             else:
-                # for floating point grid:
-                self.grid[self.grid == self.nodatavalue] = np.nan
+                # for floating point grid (in place):
+                np.putmask(self.grid, self.grid == self.nodatavalue, np.nan)
         return None
 
     def insert_nodata(self):
@@ -4038,13 +4604,30 @@ class Raster:
             pass
         else:
             if self.grid.dtype.kind in ["i", "u"]:
-                # for integer grid
-                self.grid = np.ma.filled(self.grid, fill_value=self.nodatavalue)
+                # for integer grid (masked cells are filled in place)
+                if np.ma.is_masked(self.grid):
+                    np.copyto(
+                        self.grid.data,
+                        self.nodatavalue,
+                        where=self.grid.mask,
+                        casting="unsafe",
+                    )
+                self.grid = np.ma.getdata(self.grid)
             else:
-                # for floating point grid:
-                self.grid = np.nan_to_num(self.grid, nan=self.nodatavalue)
+                # for floating point grid (in place):
+                self.grid = np.nan_to_num(self.grid, copy=False, nan=self.nodatavalue)
         return None
 
+    def _get_filled_grid(self):
+        """Get the grid data with NODATA in masked cells, leaving the grid as is.
+
+        :return: grid data (not a copy if no cell is masked)
+        :rtype: :class:`numpy.ndarray`
+        """
+        if self.nodatavalue is not None and np.ma.is_masked(self.grid):
+            return np.ma.filled(self.grid, self.nodatavalue)
+        return np.ma.getdata(self.grid)
+
     def rebase_grid(self, base_raster, inplace=False, method="linear_model"):
         """Rebase the grid of a raster.
 
@@ -4081,19 +4664,35 @@ class Raster:
         >>> # Example with inplace=False
         >>> rebased_grid = raster.rebase_grid(base_raster=reference_raster, inplace=False)
         """
-        from scipy.interpolate import griddata
+        from scipy.interpolate import (
+            LinearNDInterpolator,
+            NearestNDInterpolator,
+            CloughTocher2DInterpolator,
+        )
 
-        # get data points
-        _df = self.get_grid_datapoints(drop_nan=True)
+        # get data points (as arrays)
+        dct_points = self.get_grid_datapoints(drop_nan=True, as_dataframe=False)
         # get base grid data points
-        _dfi = base_raster.get_grid_datapoints(drop_nan=False)
-        # set data points
-        grd_points = np.array([_df["x"].values, _df["y"].values]).transpose()
-        grd_new_points = np.array([_dfi["x"].values, _dfi["y"].values]).transpose()
-        _dfi["zi"] = griddata(
-            points=grd_points, values=_df["z"].values, xi=grd_new_points, method=method
+        dct_new_points = base_raster.get_grid_datapoints(
+            drop_nan=False, as_dataframe=False
         )
-        grd_zi = np.reshape(_dfi["zi"].values, newshape=base_raster.grid.shape)
+        # set data points
+        grd_points = np.column_stack([dct_points["x"], dct_points["y"]])
+        grd_new_points = np.column_stack([dct_new_points["x"], dct_new_points["y"]])
+        # set interpolator (the triangulation is reused across calls)
+        if method == "nearest":
+            interp = NearestNDInterpolator(grd_points, dct_points["z"])
+        elif method == "cubic":
+            interp = CloughTocher2DInterpolator(
+                _get_triangulation(grd_points), dct_points["z"]
+            )
+        elif method in ["linear", "linear_model"]:
+            interp = LinearNDInterpolator(
+                _get_triangulation(grd_points), dct_points["z"]
+            )
+        else:
+            raise ValueError("method must be 'linear_model', 'nearest' or 'cubic'")
+        grd_zi = np.reshape(interp(grd_new_points), base_raster.grid.shape)
         if inplace:
             # set
             self.set_grid(grid=grd_zi)
@@ -4136,17 +4735,23 @@ class Raster:
             pass
         else:
             # ensure fill on masked values
-            grid_aoi = np.ma.filled(grid_aoi, fill_value=0)
-            # replace
-            grd_mask = np.where(grid_aoi == 0, self.nodatavalue, self.grid)
+            if isinstance(grid_aoi, np.ma.MaskedArray):
+                grid_aoi = np.ma.filled(grid_aoi, fill_value=0)
+            # cells outside the AOI
+            grd_out = ~np.asarray(grid_aoi).astype(bool, copy=False)
 
             if inplace:
                 pass
             else:
-                # pass a copy to backup grid
-                self.backup_grid = self.grid.copy()
-            # set main grid
-            self.set_grid(grid=grd_mask)
+                # back up only the cells that are overwritten
+                vct_ids = np.flatnonzero(grd_out)
+                self.backup_grid = {
+                    "ids": vct_ids,
+                    "values": np.ma.getdata(self.grid).ravel()[vct_ids],
+                }
+            # replace in place
+            np.copyto(self.grid, self.nodatavalue, where=grd_out, casting="unsafe")
+            self.mask_nodata()
             self.isaoi = True
         return None
 
@@ -4161,6 +4766,7 @@ class Raster:
         **Notes:**
 
         - If an AOI mask has been applied, this function restores the original values to the main grid from the backup grid.
+        - Only the cells outside the AOI are restored (the backup holds just those cells).
         - If no AOI mask has been applied, the function has no effect.
         - After releasing the AOI mask, the backup grid is set to None, and the raster object is no longer considered to have an AOI mask.
 
@@ -4170,7 +4776,11 @@ class Raster:
         >>> raster.release_aoi_mask()
         """
         if self.isaoi:
-            self.set_grid(grid=self.backup_grid)
+            if self.backup_grid is not None:
+                # scatter the backed-up cells back into the grid
+                grd_data = np.ma.getdata(self.grid)
+                grd_data.flat[self.backup_grid["ids"]] = self.backup_grid["values"]
+                self.set_grid(grid=grd_data, copy=False)
             self.backup_grid = None
             self.isaoi = False
         return None
@@ -4212,15 +4822,15 @@ class Raster:
         if self.grid is None:
             return None
         else:
-            new_grid = self.grid
-            new_grid[new_grid < lower] = lower
-            new_grid[new_grid > upper] = upper
-
             if inplace:
-                self.set_grid(grid=new_grid)
+                # clip both bounds in a single pass over the grid
+                np.clip(self.grid, lower, upper, out=self.grid, casting="unsafe")
+                self.mask_nodata()
                 return None
             else:
-                return new_grid
+                # keep the grid dtype (bounds may be of another kind)
+                new_grid = np.clip(self.grid, lower, upper)
+                return new_grid.astype(self.grid.dtype, copy=False)
 
     def get_metadata(self):
         """Get all metadata from the base object.
@@ -4274,24 +4884,34 @@ class Raster:
             - "ymin" (float): Minimum y-coordinate.
             - "ymax" (float): Maximum y-coordinate.
         :rtype: dict
+
+        **Notes:**
+
+        - The bounding box is computed once and cached until ``set_asc_metadata`` is called again.
         """
-        return {
-            "xmin": self.asc_metadata["xllcorner"],
-            "xmax": self.asc_metadata["xllcorner"]
-            + (self.asc_metadata["ncols"] * self.cellsize),
-            "ymin": self.asc_metadata["yllcorner"],
-            "ymax": self.asc_metadata["yllcorner"]
-            + (self.asc_metadata["nrows"] * self.cellsize),
-        }
+        if self._bbox is None:
+            self._bbox = {
+                "xmin": self.asc_metadata["xllcorner"],
+                "xmax": self.asc_metadata["xllcorner"]
+                + (self.asc_metadata["ncols"] * self.cellsize),
+                "ymin": self.asc_metadata["yllcorner"],
+                "ymax": self.asc_metadata["yllcorner"]
+                + (self.asc_metadata["nrows"] * self.cellsize),
+            }
+        return self._bbox.copy()
 
-    def get_grid_datapoints(self, drop_nan=False):
+    def get_grid_datapoints(self, drop_nan=False, as_dataframe=True):
         """Get flat and cleared grid data points (x, y, and z).
 
         :param drop_nan: Option to ignore nan values.
         :type drop_nan: bool
 
+        :param as_dataframe: Option to return a DataFrame. If False, a dict of
+            flat arrays with the same fields is returned (no DataFrame is built).
+        :type as_dataframe: bool
+
         :return: DataFrame of x, y, and z fields.
-        :rtype: :class:`pandas.DataFrame``` or None
+        :rtype: :class:`pandas.DataFrame``` or dict or None
             If the grid is None, returns None.
 
         **Notes:**
@@ -4312,16 +4932,14 @@ class Raster:
             return None
         else:
             # get coordinates
-            vct_i = np.zeros(self.grid.shape[0] * self.grid.shape[1])
-            vct_j = vct_i.copy()
-            vct_z = vct_i.copy()
-            _c = 0
-            for i in range(len(self.grid)):
-                for j in range(len(self.grid[i])):
-                    vct_i[_c] = i
-                    vct_j[_c] = j
-                    vct_z[_c] = self.grid[i][j]
-                    _c = _c + 1
+            grd_j, grd_i = np.meshgrid(
+                np.arange(self.grid.shape[1], dtype=np.float64),
+                np.arange(self.grid.shape[0], dtype=np.float64),
+            )
+            vct_i = grd_i.ravel()
+            vct_j = grd_j.ravel()
+            # masked cells are taken as nan
+            vct_z = np.ma.filled(self.grid.astype(np.float64), np.nan).ravel()
 
             # transform
             n_height = self.grid.shape[0] * self.cellsize
@@ -4338,22 +4956,24 @@ class Raster:
 
             # drop nan or masked values:
             if drop_nan:
-                vct_j = vct_j[~np.isnan(vct_z)]
-                vct_i = vct_i[~np.isnan(vct_z)]
-                vct_x = vct_x[~np.isnan(vct_z)]
-                vct_y = vct_y[~np.isnan(vct_z)]
-                vct_z = vct_z[~np.isnan(vct_z)]
-            # built dataframe
-            _df = pd.DataFrame(
-                {
-                    "x": vct_x,
-                    "y": vct_y,
-                    "z": vct_z,
-                    "i": vct_i,
-                    "j": vct_j,
-                }
-            )
-            return _df
+                vct_mask = ~np.isnan(vct_z)
+                vct_j = vct_j[vct_mask]
+                vct_i = vct_i[vct_mask]
+                vct_x = vct_x[vct_mask]
+                vct_y = vct_y[vct_mask]
+                vct_z = vct_z[vct_mask]
+            dct_points = {
+                "x": vct_x,
+                "y": vct_y,
+                "z": vct_z,
+                "i": vct_i,
+                "j": vct_j,
+            }
+            if as_dataframe:
+                # built dataframe
+                return pd.DataFrame(dct_points)
+            else:
+                return dct_points
 
     def get_grid_data(self):
         """Get flat and cleared grid data.
@@ -4377,17 +4997,22 @@ class Raster:
             return None
         else:
             if self.grid.dtype.kind in ["i", "u"]:
-                # for integer grid
-                _grid = self.grid[~self.grid.mask]
-                return _grid
+                # for integer grid: flat data without masked values
+                return np.ma.compressed(self.grid)
             else:
-                # for floating point grid:
-                _grid = self.grid.ravel()[~np.isnan(self.grid.ravel())]
-                return _grid
-
-    def get_grid_stats(self):
+                # for floating point grid: fuse nan and mask in a single compaction
+                _grid = np.ma.getdata(self.grid)
+                _keep = np.isnan(_grid)
+                if np.ma.is_masked(self.grid):
+                    _keep |= np.ma.getmaskarray(self.grid)
+                np.logical_not(_keep, out=_keep)
+                return _grid[_keep]
+
+    def get_grid_stats(self, uni=None):
         """Get basic statistics from flat and cleared data.
 
+        :param uni: optional Univar object already built from the cleared grid data
+        :type uni: :class:`plans.analyst.Univar`, defaults to None
         :return: DataFrame of basic statistics.
         :rtype: :class:`pandas.DataFrame``` or None
             If the grid is None, returns None.
@@ -4397,6 +5022,8 @@ class Raster:
         - This function computes basic statistics from the flattened and cleared grid data.
         - Basic statistics include measures such as mean, median, standard deviation, minimum, and maximum.
         - Requires the 'plans.analyst' module for statistical analysis.
+        - Pass ``uni`` to reuse cleared data already at hand (e.g., in ``view()``).
+        - Stats are cached by grid content, so repeated calls on an unchanged grid are not recomputed.
 
         **Examples:**
 
@@ -4406,9 +5033,17 @@ class Raster:
         if self.grid is None:
             return None
         else:
-            from plans.analyst import Univar
-
-            return Univar(data=self.get_grid_data()).assess_basic_stats()
+            tpl_key = _get_grid_key(self.grid)
+            if tpl_key not in _STATS_CACHE:
+                if uni is None:
+                    from plans.analyst import Univar
+
+                    uni = Univar(data=self.get_grid_data())
+                if len(_STATS_CACHE) >= _STATS_CACHE_SIZE:
+                    # drop the oldest entry
+                    _STATS_CACHE.pop(next(iter(_STATS_CACHE)))
+                _STATS_CACHE[tpl_key] = uni.assess_basic_stats()
+            return _STATS_CACHE[tpl_key].copy()
 
     def get_aoi(self, by_value_lo, by_value_hi):
         """Get the AOI map from an interval of values (values are expected to exist in the raster).
@@ -4425,21 +5060,28 @@ class Raster:
 
         - This function creates an AOI (Area of Interest) map based on a specified value range.
         - The AOI map is constructed as a binary grid where values within the specified range are set to 1, and others to 0.
+        - NODATA (masked or NaN) cells are set to 0. The raster grid is not modified.
 
         **Examples:**
 
         >>> # Get AOI map for values between 10 and 20
         >>> aoi_map = raster.get_aoi(by_value_lo=10, by_value_hi=20)
         """
+        from plans.datasets.spatial import AOI
+
         map_aoi = AOI(name="{} {}-{}".format(self.varname, by_value_lo, by_value_hi))
         map_aoi.set_asc_metadata(metadata=self.asc_metadata)
         map_aoi.prj = self.prj
-        # set grid
-        self.insert_nodata()
-        map_aoi.set_grid(
-            grid=1 * (self.grid >= by_value_lo) * (self.grid <= by_value_hi)
-        )
-        self.mask_nodata()
+        # set grid (both bounds are written into a single uint8 output)
+        grd_data = np.ma.getdata(self.grid)
+        grd_aoi = np.empty(grd_data.shape, dtype=np.uint8)
+        grd_in = grd_aoi.view(bool)
+        np.greater_equal(grd_data, by_value_lo, out=grd_in)
+        grd_in &= grd_data <= by_value_hi
+        if np.ma.is_masked(self.grid):
+            # masked cells are outside (nan cells already compare False)
+            grd_in[self.grid.mask] = False
+        map_aoi.set_grid(grid=grd_aoi, copy=False)
         return map_aoi
 
     def _set_view_specs(self):
@@ -4472,6 +5114,7 @@ class Raster:
             "b_ylabel": "percentage",
             "b_xlabel": self.units,
             "nbins": 100,
+            "bin_scheme": "uniform",
             "vmin": None,
             "vmax": None,
             "hist_vmax": None,
@@ -4512,6 +5155,7 @@ class Raster:
         - This function generates a basic panel for visualizing the raster map, including the map itself, a histogram,
           metadata, and basic statistics.
         - The panel includes various customization options such as color, titles, dimensions, and more.
+        - The histogram bins are set by ``view_specs["bin_scheme"]``: ``"uniform"`` (``nbins`` equal bins), ``"log"`` (``nbins`` logarithmic bins of positive values, for high-dynamic-range maps) or ``"auto"`` (Freedman-Diaconis rule).
         - The resulting plot can be displayed or saved based on the specified parameters.
 
         **Examples:**
@@ -4527,13 +5171,16 @@ class Raster:
 
         # get univar base_object
         uni = Univar(data=self.get_grid_data())
+        # get stats (min and max of cleared data are used as default limits)
+        df_stats = self.get_grid_stats(uni=uni)
+        dct_stats = dict(zip(df_stats["Statistic"], df_stats["Value"]))
 
         specs = self.view_specs
 
         if specs["vmin"] is None:
-            specs["vmin"] = np.min(self.grid)
+            specs["vmin"] = dct_stats["Min"]
         if specs["vmax"] is None:
-            specs["vmax"] = np.max(self.grid)
+            specs["vmax"] = dct_stats["Max"]
 
         if specs["project_name"] is None:
             suff = ""
@@ -4559,10 +5206,18 @@ class Raster:
             i_max = specs["zoom_window"]["i_max"]
             j_min = specs["zoom_window"]["j_min"]
             j_max = specs["zoom_window"]["j_max"]
-        # plot image
+        # plot image (strided down to the figure resolution, same extent)
+        grd_view = self.grid[i_min: i_max, j_min: j_max]
+        n_rows, n_cols = grd_view.shape
+        n_stride = max(1, int(min(n_rows, n_cols) // (specs["width"] * dpi)))
         im = plt.imshow(
-            self.grid[i_min: i_max, j_min: j_max], cmap=specs["cmap"], vmin=specs["vmin"], vmax=specs["vmax"]
+            grd_view[::n_stride, ::n_stride],
+            cmap=specs["cmap"],
+            vmin=specs["vmin"],
+            vmax=specs["vmax"],
+            extent=(-0.5, n_cols - 0.5, n_rows - 0.5, -0.5),
         )
+        del grd_view
         plt.title("a. {}".format(specs["a_title"]), loc="left")
         fig.colorbar(im, shrink=0.5)
         plt.axis("off")
@@ -4570,12 +5225,28 @@ class Raster:
         # plot Hist
         plt.subplot(gs[:2, 3:])
         plt.title("b. {}".format(specs["b_title"]), loc="left")
-        vct_result = plt.hist(
-            x=uni.data,
-            bins=specs["nbins"],
+        # get bins
+        n_data = uni.data.size
+        b_log = False
+        bins = specs["nbins"]
+        if specs["bin_scheme"] == "log":
+            vct_pos = uni.data[uni.data > 0]
+            if vct_pos.size > 0:
+                b_log = True
+                n_lo = specs["vmin"] if specs["vmin"] > 0 else np.min(vct_pos)
+                bins = np.geomspace(n_lo, specs["vmax"], specs["nbins"] + 1)
+            del vct_pos
+        elif specs["bin_scheme"] == "auto":
+            bins = "fd"
+        # histogram once and draw the bars (share of all data in each bin)
+        vct_counts, vct_edges = np.histogram(uni.data, bins=bins)
+        vct_result = (vct_counts / n_data, vct_edges)
+        plt.bar(
+            vct_edges[:-1],
+            vct_result[0],
+            width=np.diff(vct_edges),
+            align="edge",
             color=specs["color"],
-            weights=np.ones(len(uni.data)) / len(uni.data)
-            # orientation="horizontal"
         )
 
         # get upper limit if none
@@ -4591,15 +5262,23 @@ class Raster:
             linestyles="--",
             # label="mean ({:.2f})".fig_format(n_mean)
         )
+        if b_log:
+            n_text_x = n_mean / np.power(vct_edges[-1] / vct_edges[0], 0.2)
+        else:
+            n_text_x = n_mean - 20 * (specs["vmax"] - specs["vmin"]) / 100
         plt.text(
-            x=n_mean - 20 * (specs["vmax"] - specs["vmin"]) / 100,
+            x=n_text_x,
             y=0.9 * specs["hist_vmax"],
             s="$\mu$ = {:.2f}".format(n_mean),
             color="red"
         )
 
         plt.ylim(0, specs["hist_vmax"])
-        plt.xlim(specs["vmin"], specs["vmax"])
+        if b_log:
+            plt.xscale("log")
+            plt.xlim(vct_edges[0], vct_edges[-1])
+        else:
+            plt.xlim(specs["vmin"], specs["vmax"])
 
         # plt.ylabel(specs["b_ylabel"])
         plt.xlabel(specs["b_xlabel"])
@@ -4613,21 +5292,28 @@ class Raster:
         # plot accumulated probability
         if accum:
             ax2 = ax.twinx()
-            vct_cump = np.cumsum(a=vct_result[0]) / np.sum(vct_result[0])
+            vct_cump = np.cumsum(vct_counts, dtype=np.float64)
+            vct_cump /= vct_cump[-1]
             plt.plot(vct_result[1][1:], vct_cump, color="darkred")
             ax2.grid(False)
 
         # ------------------------------------------------------------------
         # plot metadata
 
-        # get datasets
-        df_stats = self.get_grid_stats()
-        lst_meta = []
-        lst_value = []
-        for k in self.asc_metadata:
-            lst_value.append(self.asc_metadata[k])
-            lst_meta.append(k)
-        df_meta = pd.DataFrame({"Raster": lst_meta, "Value": lst_value})
+        # release the cleared data before rendering
+        del uni, vct_result, vct_counts
+        # get metadata lines
+        lst_lines = []
+        for s_head in self.asc_metadata:
+            s_value = self.asc_metadata[s_head]
+            s_fmt = "{:>15}: {:<10.2f}"
+            if s_head == "cellsize":
+                s_value = self.cellsize
+                s_fmt = "{:>15}: {:<10.5f}"
+            if s_value is None:
+                s_value = "-"
+                s_fmt = "{:>15}: {:<10}"
+            lst_lines.append(s_fmt.format(s_head, s_value))
         # metadata
         n_y = 0.25
         n_x = 0.08
@@ -4640,22 +5326,7 @@ class Raster:
         )
         n_y = n_y - 0.01
         n_step = 0.025
-        for i in range(len(df_meta)):
-            s_head = df_meta["Raster"].values[i]
-            if s_head == "cellsize":
-                s_value = self.cellsize
-                if s_value is None:
-                    s_value = '-'
-                    s_line = "{:>15}: {:<10}".format(s_head, s_value)
-                else:
-                    s_line = "{:>15}: {:<10.5f}".format(s_head, s_value)
-            else:
-                s_value = df_meta["Value"].values[i]
-                if s_value is None:
-                    s_value = '-'
-                    s_line = "{:>15}: {:<10}".format(s_head, s_value)
-                else:
-                    s_line = "{:>15}: {:<10.2f}".format(s_head, s_value)
+        for s_line in lst_lines:
             n_y = n_y - n_step
             plt.text(
                 x=n_x,
@@ -4679,10 +5350,14 @@ class Raster:
             )
             n_y = n_y_base - 0.01
             n_step = 0.025
-            for i in range(7):
-                s_head = df_stats["Statistic"].values[i]
-                s_value = df_stats["Value"].values[i]
-                s_line = "{:>10}: {:<10.2f}".format(s_head, s_value)
+            # get stats lines
+            lst_lines = [
+                "{:>10}: {:<10.2f}".format(s_head, s_value)
+                for s_head, s_value in zip(
+                    df_stats["Statistic"].to_numpy(), df_stats["Value"].to_numpy()
+                )
+            ]
+            for s_line in lst_lines[:7]:
                 n_y = n_y - n_step
                 plt.text(
                     x=n_x,
@@ -4693,10 +5368,7 @@ class Raster:
                     transform=fig.transFigure,
                 )
             n_y = n_y_base - 0.01
-            for i in range(7, len(df_stats)):
-                s_head = df_stats["Statistic"].values[i]
-                s_value = df_stats["Value"].values[i]
-                s_line = "{:>10}: {:<10.2f}".format(s_head, s_value)
+            for s_line in lst_lines[7:]:
                 n_y = n_y - n_step
                 plt.text(
                     x=n_x + 0.15,
@@ -4750,6 +5422,8 @@ class QualiRaster(Raster):
         self.aliasfield = "Alias"
         self.colorfield = "Color"
         self.areafield = "Area"
+        # areas table of view(): {"key": content key, "df": dataframe}
+        self._view_cache = None
         # call superior
         super().__init__(name=name, dtype=dtype)
         # overwrite
@@ -4789,15 +5463,34 @@ class QualiRaster(Raster):
         :return: None
         :rtype: None
         """
-        grid_new = self.grid.copy()
+        grd_data = np.ma.getdata(self.grid)
+        # get ids of the grid (a dense range if not larger than the grid)
+        n_min = int(grd_data.min())
+        n_max = int(grd_data.max())
+        b_dense = n_max - n_min < grd_data.size
+        if b_dense:
+            vct_ids = np.arange(n_min, n_max + 1, dtype=np.int64)
+        else:
+            vct_ids, vct_inv = np.unique(grd_data, return_inverse=True)
+            vct_ids = vct_ids.astype(np.int64)
+        # build the lookup table (pairs are applied in order)
+        vct_lut = vct_ids.copy()
         for i in range(len(dict_ids["Old_Id"])):
             n_old_id = dict_ids["Old_Id"][i]
             n_new_id = dict_ids["New_Id"][i]
             if talk:
                 print(">> reclassify Ids from {} to {}".format(n_old_id, n_new_id))
-            grid_new = (grid_new * (grid_new != n_old_id)) + (
-                n_new_id * (grid_new == n_old_id)
-            )
+            vct_lut[vct_lut == n_old_id] = n_new_id
+        # remap the grid in a single pass
+        if b_dense:
+            grid_new = vct_lut[np.subtract(grd_data, n_min, dtype=np.intp)]
+        else:
+            grid_new = vct_lut[vct_inv].reshape(grd_data.shape)
+        if np.ma.isMaskedArray(self.grid):
+            # masked cells are kept as they are
+            grd_mask = np.ma.getmaskarray(self.grid)
+            np.copyto(grid_new, grd_data, where=grd_mask, casting="unsafe")
+            grid_new = np.ma.masked_array(grid_new, mask=grd_mask)
         # set new grid
         self.set_grid(grid=grid_new)
         # reset table
@@ -4871,6 +5564,7 @@ class QualiRaster(Raster):
         """
         self.table = dataframe_prepro(dataframe=dataframe.copy())
         self.table = self.table.sort_values(by=self.idfield).reset_index(drop=True)
+        self._view_cache = None
         # set view specs
         self._set_view_specs()
         return None
@@ -4900,6 +5594,30 @@ class QualiRaster(Raster):
             self.set_table(dataframe=self.table)
         return None
 
+    def _count_by_id(self):
+        """Count the unmasked cells of each table id in a single pass.
+
+        :return: cell counts aligned with the table rows
+        :rtype: :class:`numpy.ndarray`
+        """
+        _vct_flat = np.ma.compressed(self.grid)
+        _vct_ids = self.table[self.idfield].values
+        if _vct_flat.size > 0 and 0 <= _vct_flat.min() and (
+            _vct_flat.max() < max(_vct_flat.size, 256)
+        ):
+            _vct_counts = np.bincount(_vct_flat.astype(np.intp, copy=False))
+            _vct_ok = (_vct_ids >= 0) & (_vct_ids < _vct_counts.size)
+            _vct_count = np.zeros(len(_vct_ids), dtype=np.int64)
+            _vct_count[_vct_ok] = _vct_counts[_vct_ids[_vct_ok].astype(np.intp)]
+        else:
+            _vct_uni, _vct_counts = np.unique(_vct_flat, return_counts=True)
+            _dct_counts = dict(zip(_vct_uni.tolist(), _vct_counts.tolist()))
+            _vct_count = np.array(
+                [_dct_counts.get(_n_id, 0) for _n_id in _vct_ids.tolist()],
+                dtype=np.int64,
+            )
+        return _vct_count
+
     def get_areas(self, merge=False):
         """Get export_areas in map of each category in table.
 
@@ -4918,17 +5636,13 @@ class QualiRaster(Raster):
             _n_unit_area = np.square(_cell_size)
             # get aux dataframe
             df_aux = self.table[["Id", "Name", "Alias"]].copy()
-            _lst_count = []
-            # iterate categories
-            for i in range(len(df_aux)):
-                _n_id = df_aux[self.idfield].values[i]
-                _n_count = np.sum(1 * (self.grid == _n_id))
-                _lst_count.append(_n_count)
+            # count all categories in a single pass (masked cells left out)
+            _vct_count = self._count_by_id()
             # set area fields
             lst_area_fields = []
             # Count
             s_count_field = "Cell_count"
-            df_aux[s_count_field] = _lst_count
+            df_aux[s_count_field] = _vct_count
             lst_area_fields.append(s_count_field)
 
             # m2
@@ -4951,12 +5665,13 @@ class QualiRaster(Raster):
             # fraction
             s_field = "{}_f".format(self.areafield)
             lst_area_fields.append(s_field)
-            df_aux[s_field] = df_aux[s_count_field] / df_aux[s_count_field].sum()
-            # %
-            s_field = "{}_%".format(self.areafield)
-            lst_area_fields.append(s_field)
-            df_aux[s_field] = 100 * df_aux[s_count_field] / df_aux[s_count_field].sum()
-            df_aux[s_field] = df_aux[s_field].round(2)
+            _n_total = _vct_count.sum()
+            with np.errstate(divide="ignore", invalid="ignore"):
+                df_aux[s_field] = _vct_count / _n_total
+                # %
+                s_field = "{}_%".format(self.areafield)
+                lst_area_fields.append(s_field)
+                df_aux[s_field] = np.round(100 * _vct_count / _n_total, 2)
 
             # handle merge
             if merge:
@@ -4965,6 +5680,28 @@ class QualiRaster(Raster):
 
             return df_aux
 
+    def _get_view_areas(self):
+        """Get the areas table of ``view()``, reusing the last one if nothing changed.
+
+        The table is keyed by grid content, table content, cell size and projection,
+        so in place edits of the grid or table are not missed.
+
+        :return: table colors merged with export_areas
+        :rtype: :class:`pandas.DataFrame`
+        """
+        tpl_key = (
+            _get_grid_key(self.grid),
+            int(pd.util.hash_pandas_object(self.table, index=False).sum()),
+            self.cellsize,
+            self.prj,
+        )
+        if self._view_cache is None or self._view_cache["key"] != tpl_key:
+            df_areas = pd.merge(
+                self.table[["Id", "Color"]], self.get_areas(), how="left", on="Id"
+            )
+            self._view_cache = {"key": tpl_key, "df": df_areas}
+        return self._view_cache["df"].copy()
+
     def get_zonal_stats(self, raster_sample, merge=False, skip_count=False):
         """Get zonal stats from other raster map to sample.
 
@@ -4987,40 +5724,40 @@ class QualiRaster(Raster):
         self.set_table(dataframe=df_aux1)  # restore uncleaned table
         ##### df_aux = self.table[["Id", "Name", "Alias"]].copy()
 
-        # store copy of raster
-        grid_raster = raster_sample.grid
         varname = raster_sample.varname
+        # cells valid in both zones and sample grids
+        grd_zones = np.ma.getdata(self.grid)
+        grd_sample = np.ma.getdata(raster_sample.grid)
+        grd_valid = ~np.ma.getmaskarray(self.grid)
+        if np.ma.is_masked(raster_sample.grid):
+            grd_valid &= ~np.ma.getmaskarray(raster_sample.grid)
+        if grd_sample.dtype.kind == "f":
+            grd_valid &= ~np.isnan(grd_sample)
+        # group sample values by zone with a single (stable) sort
+        vct_zones = grd_zones[grd_valid]
+        vct_order = np.argsort(vct_zones, kind="stable")
+        vct_zones = vct_zones[vct_order]
+        vct_sample = grd_sample[grd_valid][vct_order]
+        del grd_valid, vct_order
+        vct_ids = df_aux["Id"].values
+        vct_lo = np.searchsorted(vct_zones, vct_ids, side="left")
+        vct_hi = np.searchsorted(vct_zones, vct_ids, side="right")
+
         # collect statistics
         lst_stats = []
-        for i in range(len(df_aux)):
-            n_id = df_aux["Id"].values[i]
-            # apply mask
-            grid_aoi = 1 * (self.grid == n_id)
-            raster_sample.apply_aoi_mask(grid_aoi=grid_aoi, inplace=True)
-            # get basic stats
-            raster_uni = Univar(data=raster_sample.get_grid_data(), name=varname)
+        for i in range(len(vct_ids)):
+            raster_uni = Univar(data=vct_sample[vct_lo[i]: vct_hi[i]], name=varname)
             df_stats = raster_uni.assess_basic_stats()
-            lst_stats.append(df_stats.copy())
-            # restore
-            raster_sample.grid = grid_raster
-
-        # create empty fields
-        lst_stats_field = []
-        for k in df_stats["Statistic"]:
-            s_field = "{}_{}".format(varname, k)
-            lst_stats_field.append(s_field)
-            df_aux[s_field] = 0.0
+            lst_stats.append(df_stats["Value"].values)
 
-        # fill values
-        for i in range(len(df_aux)):
-            df_aux.loc[i, lst_stats_field[0] : lst_stats_field[-1]] = lst_stats[i][
-                "Value"
-            ].values
+        # fill fields (a single block of zones x stats)
+        lst_stats_field = ["{}_{}".format(varname, k) for k in df_stats["Statistic"]]
+        df_aux[lst_stats_field] = np.array(lst_stats, dtype=np.float64)
 
         # handle count
         if skip_count:
-            df_aux = df_aux.drop(columns=["{}_count".format(varname)])
-            lst_stats_field.remove("{}_count".format(varname))
+            df_aux = df_aux.drop(columns=["{}_Count".format(varname)])
+            lst_stats_field.remove("{}_Count".format(varname))
 
         # handle merge
         if merge:
@@ -5037,13 +5774,14 @@ class QualiRaster(Raster):
         :return: AOI map
         :rtype: :class:`AOI`` object
         """
+        from plans.datasets.spatial import AOI
+
         map_aoi = AOI(name="{} {}".format(self.varname, by_value_id))
         map_aoi.set_asc_metadata(metadata=self.asc_metadata)
         map_aoi.prj = self.prj
         # set grid
-        self.insert_nodata()
-        map_aoi.set_grid(grid=1 * (self.grid == by_value_id))
-        self.mask_nodata()
+        grd_aoi = (self._get_filled_grid() == by_value_id).view(np.uint8)
+        map_aoi.set_grid(grid=grd_aoi, copy=False)
         return map_aoi
 
     def get_metadata(self):
@@ -5073,13 +5811,16 @@ class QualiRaster(Raster):
             else:
                 self.set_random_colors()
 
-            # hack for non-continuous ids:
-            _all_ids = np.arange(0, self.table[self.idfield].max() + 1)
-            _lst_colors = []
-            for i in range(0, len(_all_ids)):
-                _df = self.table.query("{} >= {}".format(self.idfield, i)).copy()
-                _color = _df[self.colorfield].values[0]
-                _lst_colors.append(_color)
+            # hack for non-continuous ids (color of the first row with id >= i):
+            _vct_ids = self.table[self.idfield].values
+            _all_ids = np.arange(0, _vct_ids.max() + 1)
+            _vct_order = np.argsort(_vct_ids, kind="stable")
+            # first row (in table order) among ids from each sorted position on
+            _vct_first = np.minimum.accumulate(_vct_order[::-1])[::-1]
+            _vct_rows = _vct_first[
+                np.searchsorted(_vct_ids[_vct_order], _all_ids, side="left")
+            ]
+            _lst_colors = list(self.table[self.colorfield].values[_vct_rows])
             # setup
             self.view_specs = {
                 "color": "tab:grey",
@@ -5155,44 +5896,34 @@ class QualiRaster(Raster):
 
         # -----------------------------------------------
         # ensure export_areas are computed
-        df_areas = pd.merge(
-            self.table[["Id", "Color"]], self.get_areas(), how="left", on="Id"
-        )
+        df_areas = self._get_view_areas()
         # new aux
         df_aux = df_areas.sort_values(by="{}_m2".format(self.areafield), ascending=True)
         if filter:
             if len(df_aux) > n_filter:
-                n_limit = df_aux["{}_m2".format(self.areafield)].values[-n_filter]
-                df_aux2 = df_aux.query("{}_m2 < {}".format(self.areafield, n_limit))
-                df_aux2 = pd.DataFrame(
-                    {
+                s_m2_field = "{}_m2".format(self.areafield)
+                vct_m2 = df_aux[s_m2_field].to_numpy(copy=False)
+                n_limit = vct_m2[-n_filter]
+                vct_top = vct_m2 >= n_limit
+                df_tail = df_aux[~vct_top]
+                df_aux = df_aux[vct_top]
+                # collapse the tail into a single "Others" row
+                if not (df_aux["Id"] == 0).any():
+                    dct_others = {
                         "Id": [0],
                         "Color": ["tab:grey"],
                         "Name": ["Others"],
                         "Alias": ["etc"],
-                        "Cell_count": [df_aux2["Cell_count"].sum()],
-                        "{}_m2".format(self.areafield): [
-                            df_aux2["{}_m2".format(self.areafield)].sum()
-                        ],
-                        "{}_ha".format(self.areafield): [
-                            df_aux2["{}_ha".format(self.areafield)].sum()
-                        ],
-                        "{}_km2".format(self.areafield): [
-                            df_aux2["{}_km2".format(self.areafield)].sum()
-                        ],
-                        "{}_f".format(self.areafield): [
-                            df_aux2["{}_f".format(self.areafield)].sum()
-                        ],
-                        "{}_%".format(self.areafield): [
-                            df_aux2["{}_%".format(self.areafield)].sum()
-                        ],
                     }
-                )
-                df_aux = df_aux.query("{}_m2 >= {}".format(self.areafield, n_limit))
-                df_aux = pd.concat([df_aux, df_aux2])
-                df_aux = df_aux.drop_duplicates(subset="Id")
-                df_aux = df_aux.sort_values(by="{}_m2".format(self.areafield))
-                df_aux = df_aux.reset_index(drop=True)
+                    for s_field in ["Cell_count"] + [
+                        "{}_{}".format(self.areafield, s_unit)
+                        for s_unit in ["m2", "ha", "km2", "f", "%"]
+                    ]:
+                        dct_others[s_field] = [df_tail[s_field].to_numpy().sum()]
+                    df_aux = pd.concat(
+                        [df_aux, pd.DataFrame(dct_others)], ignore_index=True
+                    )
+                df_aux = df_aux.sort_values(by=s_m2_field).reset_index(drop=True)
 
         # -----------------------------------------------
         # Deploy figure
@@ -5221,24 +5952,31 @@ class QualiRaster(Raster):
             i_max = specs["zoom_window"]["i_max"]
             j_min = specs["zoom_window"]["j_min"]
             j_max = specs["zoom_window"]["j_max"]
-        # plot image
+        # plot image (strided down to the figure resolution, same extent)
+        grd_view = self.grid[i_min: i_max, j_min: j_max]
+        n_rows, n_cols = grd_view.shape
+        n_stride = max(1, int(min(n_rows, n_cols) // (specs["width"] * dpi)))
         im = plt.imshow(
-            self.grid[i_min: i_max, j_min: j_max], cmap=specs["cmap"], vmin=specs["vmin"], vmax=specs["vmax"]
+            grd_view[::n_stride, ::n_stride],
+            cmap=specs["cmap"],
+            vmin=specs["vmin"],
+            vmax=specs["vmax"],
+            extent=(-0.5, n_cols - 0.5, n_rows - 0.5, -0.5),
         )
+        del grd_view
         plt.title("a. {}".format(specs["a_title"]), loc="left")
         plt.axis("off")
 
         # place legend
+        _vct_colors = df_aux[self.colorfield].to_numpy(copy=False)
+        _vct_names = df_aux[self.namefield].to_numpy(copy=False)
+        _vct_aliases = df_aux[self.aliasfield].to_numpy(copy=False)
         legend_elements = []
         for i in range(len(df_aux)):
-            _color = df_aux[self.colorfield].values[i]
-            _label = "{} ({})".format(
-                df_aux[self.namefield].values[i],
-                df_aux[self.aliasfield].values[i],
-            )
+            _label = "{} ({})".format(_vct_names[i], _vct_aliases[i])
             legend_elements.append(
                 Patch(
-                    facecolor=_color,
+                    facecolor=_vct_colors[i],
                     label=_label,
                 )
             )
@@ -5271,9 +6009,13 @@ class QualiRaster(Raster):
             specs["b_xmax"] = df_aux[
                 "{}_{}".format(self.areafield, specs["b_area"])
             ].max()
+        _vct_areas = df_aux[
+            "{}_{}".format(self.areafield, specs["b_area"])
+        ].to_numpy(copy=False)
+        _vct_pcts = df_aux["{}_%".format(self.areafield)].to_numpy(copy=False)
         for i in range(len(df_aux)):
-            v = df_aux["{}_{}".format(self.areafield, specs["b_area"])].values[i]
-            p = df_aux["{}_%".format(self.areafield)].values[i]
+            v = _vct_areas[i]
+            p = _vct_pcts[i]
             plt.text(
                 v + specs["b_xmax"] / 50,
                 i - 0.3,
@@ -5287,12 +6029,15 @@ class QualiRaster(Raster):
         # -----------------------------------------------
         # plot metadata
         if specs["plot_metadata"]:
-            lst_meta = []
-            lst_value = []
-            for k in self.asc_metadata:
-                lst_value.append(self.asc_metadata[k])
-                lst_meta.append(k)
-            df_meta = pd.DataFrame({"Raster": lst_meta, "Value": lst_value})
+            # get metadata lines
+            lst_lines = []
+            for s_head in self.asc_metadata:
+                if s_head == "cellsize":
+                    s_line = "{:>15}: {:<10.5f}".format(s_head, self.cellsize)
+                else:
+                    s_value = self.asc_metadata[s_head]
+                    s_line = "{:>15}: {:<10.2f}".format(s_head, s_value)
+                lst_lines.append(s_line)
             # metadata
             n_y = 0.25
             n_x = 0.62
@@ -5305,14 +6050,7 @@ class QualiRaster(Raster):
             )
             n_y = n_y - 0.01
             n_step = 0.025
-            for i in range(len(df_meta)):
-                s_head = df_meta["Raster"].values[i]
-                if s_head == "cellsize":
-                    s_value = self.cellsize
-                    s_line = "{:>15}: {:<10.5f}".format(s_head, s_value)
-                else:
-                    s_value = df_meta["Value"].values[i]
-                    s_line = "{:>15}: {:<10.2f}".format(s_head, s_value)
+            for s_line in lst_lines:
                 n_y = n_y - n_step
                 plt.text(
                     x=n_x,
@@ -5396,35 +6134,30 @@ class Zones(QualiRaster):
         self.units = "zones ID"
         self.table = None
 
-    def set_table(self):
-        if self.grid is None:
+    def set_table(self, dataframe=None):
+        """Set the zones table from the unique ids of the grid.
+
+        :param dataframe: incoming table (e.g., with new colors), defaults to None (build it from the grid)
+        :type dataframe: :class:`pandas.DataFrame`
+        """
+        if dataframe is not None:
+            super().set_table(dataframe=dataframe)
+        elif self.grid is None:
             self.table = None
         else:
-            self.insert_nodata()
-            # get unique values
-            vct_unique = np.unique(self.grid)
-            # reapply mask
-            self.mask_nodata()
+            # get unique values (sorted) but nodata
+            vct_unique = np.unique(self._get_filled_grid())
+            vct_unique = vct_unique[vct_unique != self.asc_metadata["NODATA_value"]]
+            vct_unique = vct_unique.astype(int)
+            vct_labels = vct_unique.astype(str)
             # set table
             self.table = pd.DataFrame(
                 {
                     "Id": vct_unique,
-                    "Alias": [
-                        "{}{}".format(self.varalias, vct_unique[i])
-                        for i in range(len(vct_unique))
-                    ],
-                    "Name": [
-                        "{} {}".format(self.varname, vct_unique[i])
-                        for i in range(len(vct_unique))
-                    ],
+                    "Alias": np.char.add(self.varalias, vct_labels),
+                    "Name": np.char.add(self.varname + " ", vct_labels),
                 }
             )
-            self.table = self.table.drop(
-                self.table[self.table["Id"] == self.asc_metadata["NODATA_value"]].index
-            )
-            self.table["Id"] = self.table["Id"].astype(int)
-            self.table = self.table.sort_values(by="Id")
-            self.table = self.table.reset_index(drop=True)
             self.set_random_colors()
             # set view specs
             self._set_view_specs()
@@ -5433,8 +6166,8 @@ class Zones(QualiRaster):
             del vct_unique
             return None
 
-    def set_grid(self, grid):
-        super().set_grid(grid)
+    def set_grid(self, grid, copy=True):
+        super().set_grid(grid, copy=copy)
         self.set_table()
         return None
 
@@ -5460,13 +6193,14 @@ class Zones(QualiRaster):
         :return: AOI map
         :rtype: :class:`AOI`` object
         """
+        from plans.datasets.spatial import AOI
+
         map_aoi = AOI(name="{} {}".format(self.varname, zone_id))
         map_aoi.set_asc_metadata(metadata=self.asc_metadata)
         map_aoi.prj = self.prj
         # set grid
-        self.insert_nodata()
-        map_aoi.set_grid(grid=1 * (self.grid == zone_id))
-        self.mask_nodata()
+        grd_aoi = (self._get_filled_grid() == zone_id).view(np.uint8)
+        map_aoi.set_grid(grid=grd_aoi, copy=False)
         return map_aoi
 
     def view(
@@ -5504,9 +6238,7 @@ class Zones(QualiRaster):
         map_zones_aux.cmap = "tab20"
 
         # grid setup
-        self.insert_nodata()
-        map_zones_aux.set_grid(grid=self.grid)
-        self.mask_nodata()
+        map_zones_aux.set_grid(grid=self._get_filled_grid())
         map_zones_aux._set_view_specs()
         map_zones_aux.view_specs["vmin"] = self.table["Id"].min()
         map_zones_aux.view_specs["vmax"] = self.table["Id"].max()
@@ -5933,7 +6665,9 @@ class RasterCollection(Collection):
                 color=dct_colors[name],
             )
             if datapoints:
-                df_dpoints = self.collection[name].get_grid_datapoints(drop_nan=False)
+                df_dpoints = self.collection[name].get_grid_datapoints(
+                    drop_nan=False, as_dataframe=False
+                )
                 plt.scatter(
                     df_dpoints["x"], df_dpoints["y"], color=dct_colors[name], marker="."
                 )
@@ -6549,8 +7283,7 @@ class QualiRasterSeries(RasterSeries):
         if specs is None:
             pass
         else:  # override default
-            for k in specs:
-                default_specs[k] = specs[k]
+            default_specs.update(specs)
         specs = default_specs
 
         # compute export_areas
@@ -1,4 +1,70 @@
 from plans.datasets.core import *
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _hydro_soils_numpy(lito, valid, hand, slope, n_hand, n_slope):
+    """Get hydrological soil ids from lithology, HAND and slope grids.
+
+    :param lito: lithology ids
+    :type lito: :class:`numpy.ndarray`
+    :param valid: mask of valid lithology cells
+    :type valid: :class:`numpy.ndarray`
+    :param hand: HAND values (``nan`` for no-data)
+    :type hand: :class:`numpy.ndarray`
+    :param slope: slope values (``nan`` for no-data)
+    :type slope: :class:`numpy.ndarray`
+    :param n_hand: HAND threshold for alluvial definition
+    :type n_hand: float
+    :param n_slope: slope threshold for colluvial definition
+    :type n_slope: float
+    :return: soil ids (residual, colluvial +10 and alluvial as the last id) and alluvial id
+    :rtype: tuple
+    """
+    grd_soils = lito.astype(np.int64) + np.where(slope > n_slope, 10, 0)
+    grd_soils *= hand > n_hand
+    n_all_id = np.max(grd_soils, where=valid, initial=0) + 1
+    grd_soils[hand <= n_hand] = n_all_id
+    return grd_soils, n_all_id
+
+
+def _hydro_soils_loop(lito, valid, hand, slope, n_hand, n_slope):
+    """Loop kernel of :func:`_hydro_soils_numpy`, compiled by numba if available
+
+    All grids are read in a single pass (plus a pass for alluvial cells).
+    """
+    n_rows, n_cols = lito.shape
+    grd_soils = np.zeros((n_rows, n_cols), dtype=np.int64)
+    vct_max = np.zeros(n_rows, dtype=np.int64)
+    for i in prange(n_rows):
+        n_row_max = 0
+        for j in range(n_cols):
+            if hand[i, j] > n_hand:
+                n_id = np.int64(lito[i, j])
+                if slope[i, j] > n_slope:
+                    n_id += 10
+                grd_soils[i, j] = n_id
+                if valid[i, j] and n_id > n_row_max:
+                    n_row_max = n_id
+        vct_max[i] = n_row_max
+    n_all_id = vct_max.max() + 1
+    for i in prange(n_rows):
+        for j in range(n_cols):
+            if hand[i, j] <= n_hand:
+                grd_soils[i, j] = n_all_id
+    return grd_soils, n_all_id
+
+
+# use the compiled kernel if numba is available
+if njit is None:
+    _hydro_soils = _hydro_soils_numpy
+else:
+    _hydro_soils = njit(cache=True, parallel=True)(_hydro_soils_loop)
+
 # -----------------------------------------
 # Derived Raster data structures
 
@@ -24,10 +90,89 @@ class Elevation(Raster):
         self._set_view_specs()
 
     def get_tpi(self, cell_radius):
-        print("ah shit")
+        """Get the Topographic Position Index (TPI) grid.
+
+        :param cell_radius: radius of the moving window in number of cells
+        :type cell_radius: int
+        :return: TPI grid (``nan`` for no-data cells) or None if grid is None
+        :rtype: :class:`numpy.ndarray` or None
+
+        **Notes:**
+
+        - TPI is the cell elevation minus the mean elevation of a square window of ``2 * cell_radius + 1`` cells wide.
+        - The window mean ignores no-data cells and is computed with separable box filters (``scipy.ndimage.uniform_filter``), so the cost does not grow with the window size.
+
+        **Examples:**
+
+        >>> grd_tpi = dem.get_tpi(cell_radius=5)
+        """
+        if self.grid is None:
+            return None
+        from scipy.ndimage import uniform_filter
+
+        n_size = 2 * int(cell_radius) + 1
+        grd_z = np.ma.filled(self.grid.astype(np.float64), np.nan)
+        grd_valid = ~np.isnan(grd_z)
+        # mean of valid cells = mean of zero-filled values / fraction of valid cells
+        grd_sum = uniform_filter(np.where(grd_valid, grd_z, 0.0), size=n_size)
+        grd_count = uniform_filter(grd_valid.astype(np.float64), size=n_size)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            grd_tpi = grd_z - (grd_sum / grd_count)
+        return grd_tpi.astype(np.float32)
 
     def get_tpi_landforms(self, radius_micro, radius_macro):
-        print("ah shit")
+        """Get the TPI-based landform classes grid.
+
+        :param radius_micro: radius of the small-scale window in number of cells
+        :type radius_micro: int
+        :param radius_macro: radius of the large-scale window in number of cells
+        :type radius_macro: int
+        :return: landform classes grid (0 for no-data cells) or None if grid is None
+        :rtype: :class:`numpy.ndarray` or None
+
+        **Notes:**
+
+        - Classes follow Weiss (2001), by crossing the standardized TPI (in standard deviation units) at both scales:
+
+            1. Canyons, deeply incised streams
+            2. Midslope drainages, shallow valleys
+            3. Upland drainages, headwaters
+            4. U-shaped valleys
+            5. Plains (slope up to 5 degrees)
+            6. Open slopes
+            7. Upper slopes, mesas
+            8. Local ridges, hills in valleys
+            9. Midslope ridges, small hills in plains
+            10. Mountain tops, high ridges
+
+        **Examples:**
+
+        >>> grd_lnd = dem.get_tpi_landforms(radius_micro=5, radius_macro=50)
+        """
+        if self.grid is None:
+            return None
+
+        def _classes(grd_tpi):
+            # standardized TPI: -1 (low), 0 (middle), 1 (high)
+            _grd = (grd_tpi - np.nanmean(grd_tpi)) / np.nanstd(grd_tpi)
+            return (_grd >= 1).astype(np.int8) - (_grd <= -1).astype(np.int8)
+
+        grd_micro = self.get_tpi(cell_radius=radius_micro)
+        grd_macro = self.get_tpi(cell_radius=radius_macro)
+        # get slope in degrees
+        n_cell_size = self.cellsize
+        if self.prj is not None and self.prj[:6] == "GEOGCS":
+            n_cell_size = self.cellsize * 111111  # convert degrees to meters
+        grd_z = np.ma.filled(self.grid.astype(np.float64), np.nan)
+        grd_dy, grd_dx = np.gradient(grd_z, n_cell_size)
+        grd_slope = np.degrees(np.arctan(np.hypot(grd_dx, grd_dy)))
+        # lookup of classes by (micro, macro) positions
+        grd_lut = np.array([[1, 2, 3], [4, 5, 7], [8, 9, 10]], dtype=np.uint8)
+        grd_landforms = grd_lut[_classes(grd_micro) + 1, _classes(grd_macro) + 1]
+        # split open slopes from plains
+        grd_landforms[(grd_landforms == 5) & (grd_slope > 5)] = 6
+        grd_landforms[np.isnan(grd_micro)] = 0
+        return grd_landforms
 
 
 class Slope(Raster):
@@ -153,9 +298,9 @@ class NDVI(Raster):
         self.view_specs["vmin"] = -1
         self.view_specs["vmax"] = 1
 
-    def set_grid(self, grid):
-        super().set_grid(grid)
-        self.cut_edges(upper=1, lower=-1)
+    def set_grid(self, grid, copy=True):
+        super().set_grid(grid, copy=copy)
+        self.cut_edges(upper=1, lower=-1, inplace=True)
         return None
 
 
@@ -189,9 +334,9 @@ class ET24h(Raster):
         self.view_specs["vmin"] = 0
         self.view_specs["vmax"] = 15
 
-    def set_grid(self, grid):
-        super().set_grid(grid)
-        self.cut_edges(upper=100, lower=0)
+    def set_grid(self, grid, copy=True):
+        super().set_grid(grid, copy=copy)
+        self.cut_edges(upper=100, lower=0, inplace=True)
         return None
 
 
@@ -337,14 +482,15 @@ class HabQuality(Raster):
         :rtype: Raster
         """
         s = self.cellsize
-        grid_ba = b_a * np.square(s) * self.grid / 10000
+        # fold the scalars so the grid is multiplied only once
+        grid_ba = self.grid * (b_a * s * s / 10000)
         # instantiate output
         output_raster = EBA(name=self.name, date=self.date, q_a=b_a)
         # set raster
         output_raster.set_asc_metadata(metadata=self.asc_metadata)
         output_raster.prj = self.prj
-        # set grid
-        output_raster.set_grid(grid=grid_ba)
+        # set grid (already a new array)
+        output_raster.set_grid(grid=grid_ba, copy=False)
         return output_raster
 
 
@@ -398,9 +544,11 @@ class EBA(Raster):
         self.eba_global = None
         self._set_view_specs()
 
-    def set_grid(self, grid):
-        super(EBA, self).set_grid(grid)
-        self.eba_global = np.sum(grid)
+    def set_grid(self, grid, copy=True):
+        # sum before the incoming grid may be masked in place
+        # (float64 accumulator for float32 grids)
+        self.eba_global = np.sum(grid, dtype=np.float64)
+        super(EBA, self).set_grid(grid, copy=copy)
         return None
 
 
@@ -451,18 +599,15 @@ class Basins(QualiRaster):
         aoi.set_asc_metadata(metadata=self.asc_metadata)
         # get grid
         lst_ids = [basin_id]
-        grd_aoi = 1.0 * (self.grid == basin_id)
         # get extra upstream basins
         upstream_ids = Basins.get_upstream_ids(
             basin_id=basin_id,
             topology_df=self.table
         )
-        if len(upstream_ids) > 0:
-            for up_id in upstream_ids:
-                grd_aoi = grd_aoi + (1 * (self.grid == up_id))
-
-        grd_aoi = grd_aoi.astype(np.uint16)
-        aoi.set_grid(grid=grd_aoi)
+        lst_ids.extend(upstream_ids)
+        # one pass for all basin ids
+        grd_aoi = np.isin(self._get_filled_grid(), lst_ids).view(np.uint8)
+        aoi.set_grid(grid=grd_aoi, copy=False)
         return aoi
 
 
@@ -578,17 +723,18 @@ class Soils(QualiRaster):
         :rtype: None
         """
         # process grid
-        grd_soils = map_lito.grid.copy()
         # this assumes that there is less than 10 lito classes:
-        grd_slopes = 10 * (map_slope.grid > n_slope)
-        # append colluvial (+10)
-        grd_soils = grd_soils + grd_slopes
-        # append alluvial
-        grd_soils = grd_soils * (map_hand.grid > n_hand)
-        n_all_id = np.max(grd_soils) + 1
-        grd_alluvial = n_all_id * (map_hand.grid <= n_hand)
-        grd_soils = grd_soils + grd_alluvial
-        self.set_grid(grid=grd_soils)
+        # residual (lito ids), colluvial (+10) and alluvial (last id)
+        grd_valid = ~np.ma.getmaskarray(map_lito.grid)
+        grd_soils, n_all_id = _hydro_soils(
+            np.ascontiguousarray(np.ma.getdata(map_lito.grid)),
+            grd_valid,
+            np.ascontiguousarray(np.ma.filled(map_hand.grid, np.nan)),
+            np.ascontiguousarray(np.ma.filled(map_slope.grid, np.nan)),
+            float(n_hand),
+            float(n_slope),
+        )
+        self.set_grid(grid=np.ma.masked_array(grd_soils, mask=~grd_valid))
 
         # edit table
         # get table copy from lito
@@ -684,10 +830,7 @@ class AOI(QualiHard):
         map_aoi_aux.prj = self.prj
 
         # process grid
-        self.insert_nodata()
-        grd_new = 2 * np.ones(shape=self.grid.shape, dtype="byte")
-        grd_new = grd_new - (1 * (self.grid == 1))
-        self.mask_nodata()
+        grd_new = np.where(self._get_filled_grid() == 1, np.uint8(1), np.uint8(2))
         map_aoi_aux.set_grid(grid=grd_new)
         # this will call the view
         map_aoi_aux.view(
@@ -921,14 +1064,10 @@ class LULCSeries(QualiRasterSeries):
         ]
 
         # compute lulc change grid
-        grd_lulcc = (1 * (self.collection[s_name_end].grid == by_lulc_id)) - (
-            1 * (self.collection[s_name_start].grid == by_lulc_id)
-        )
-        grd_all = (1 * (self.collection[s_name_end].grid == by_lulc_id)) + (
-            1 * (self.collection[s_name_start].grid == by_lulc_id)
-        )
-        grd_all = 1 * (grd_all > 0)
-        grd_lulcc = (grd_lulcc + 2) * grd_all
+        grd_end = self.collection[s_name_end].grid == by_lulc_id
+        grd_start = self.collection[s_name_start].grid == by_lulc_id
+        # 1: loss, 2: kept, 3: gain (0 elsewhere)
+        grd_lulcc = (grd_end.astype(np.int8) - grd_start + 2) * (grd_end | grd_start)
 
         # get names
         s_name = self.name
@@ -1034,7 +1173,7 @@ class LULCSeries(QualiRasterSeries):
             map_lulc.prj = self.collection[s_name_start].prj
             #
             # apply aoi
-            grd_aoi = 1 * (self.collection[s_name_start].grid == _id)
+            grd_aoi = self.collection[s_name_start].grid == _id
             map_lulc.apply_aoi_mask(grid_aoi=grd_aoi, inplace=True)
             #
             # bypass all-masked aois
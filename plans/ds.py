@@ -65,6 +65,12 @@ import matplotlib.pyplot as plt
 import matplotlib as mpl
 import warnings
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
 warnings.filterwarnings("ignore")
 
 
@@ -81,13 +87,13 @@ def dataframe_prepro(dataframe):
     # fix headings
     dataframe.columns = dataframe.columns.str.strip()
     # strip string fields
-    for i in range(len(dataframe.columns)):
-        # if data type is string
-        if str(dataframe.dtypes.iloc[i]) == "base_object":
-            # strip all data
-            dataframe[dataframe.columns[i]] = dataframe[
-                dataframe.columns[i]
-            ].str.strip()
+    str_columns = [
+        c
+        for c in dataframe.select_dtypes(include=["object", "string"]).columns
+        if pd.api.types.infer_dtype(dataframe[c], skipna=True) == "string"
+    ]
+    if len(str_columns) > 0:
+        dataframe[str_columns] = dataframe[str_columns].apply(lambda s: s.str.strip())
     return dataframe
 
 
@@ -101,17 +107,138 @@ def get_random_colors(size=10, cmap="tab20"):
     :return: list of random colors
     :rtype: list
     """
-    import matplotlib.colors as mcolors
-
     # Choose a colormap from matplotlib
     _cmap = plt.get_cmap(cmap)
     # Generate a list of random numbers between 0 and 1
     _lst_rand_vals = np.random.rand(size)
-    # Use the colormap to convert the random numbers to colors
-    _lst_colors = [mcolors.to_hex(_cmap(x)) for x in _lst_rand_vals]
+    # Use the colormap to convert all numbers to RGB bytes at once
+    _rgb = np.round(_cmap(_lst_rand_vals)[:, :3] * 255).astype(np.uint8)
+    _lst_colors = ["#{:02x}{:02x}{:02x}".format(*c) for c in _rgb.tolist()]
     return _lst_colors
 
 
+def fit_rating_curves(vct_hobs, grd_qt, vct_h0):
+    """Utility function to fit many Rating Curves Q = a * (H - h0)^b at once
+
+    Each realization is fitted by closed-form least squares of the transformed
+    linear model ln(Q) = ln(a) + b * ln(H - h0), with a grid search on h0.
+
+    :param vct_hobs: observed stage
+    :type vct_hobs: :class:`numpy.ndarray`
+    :param grd_qt: log of observed discharge realizations, shape (runsize, n)
+    :type grd_qt: :class:`numpy.ndarray`
+    :param vct_h0: grid of h0 values
+    :type vct_h0: :class:`numpy.ndarray`
+    :return: best h0, a, b and transformed RMSE of each realization
+        (NaN for realizations without any finite fit)
+    :rtype: tuple
+    """
+    grd_qt = np.atleast_2d(grd_qt)
+    # use the compiled kernel if numba is available
+    if _fit_rating_curves_jit is not None:
+        return _fit_rating_curves_jit(
+            np.ascontiguousarray(vct_hobs, dtype=np.float64),
+            np.ascontiguousarray(grd_qt, dtype=np.float64),
+            np.ascontiguousarray(vct_h0, dtype=np.float64),
+        )
+    n_runs = len(grd_qt)
+    # center the transformed discharge once
+    vct_qt_mean = grd_qt.mean(axis=1)
+    grd_qt_c = grd_qt - vct_qt_mean[:, None]
+    # set up fits of all h0 values
+    grd_b = np.zeros(shape=(len(vct_h0), n_runs))
+    grd_c0 = np.zeros(shape=(len(vct_h0), n_runs))
+    grd_mse = np.zeros(shape=(len(vct_h0), n_runs))
+    # search loop (only over h0)
+    for i in range(len(vct_h0)):
+        # get transformed stage
+        vct_ht = np.log(vct_hobs - vct_h0[i])
+        n_ht_mean = vct_ht.mean()
+        vct_ht_c = vct_ht - n_ht_mean
+        # fit all realizations
+        grd_b[i] = (grd_qt_c @ vct_ht_c) / (vct_ht_c @ vct_ht_c)
+        grd_c0[i] = vct_qt_mean - grd_b[i] * n_ht_mean
+        grd_mse[i] = np.mean(
+            np.square(grd_qt_c - grd_b[i][:, None] * vct_ht_c[None, :]), axis=1
+        )
+    # pick the best h0 of each realization (non-finite fits are skipped)
+    grd_mse = np.where(np.isfinite(grd_mse), grd_mse, np.inf)
+    vct_ids = np.argmin(grd_mse, axis=0)
+    vct_runs = np.arange(n_runs)
+    vct_mse = grd_mse[vct_ids, vct_runs]
+    # realizations without any finite fit get NaN
+    vct_found = np.isfinite(vct_mse)
+    return (
+        np.where(vct_found, vct_h0[vct_ids], np.nan),
+        np.where(vct_found, np.exp(grd_c0[vct_ids, vct_runs]), np.nan),
+        np.where(vct_found, grd_b[vct_ids, vct_runs], np.nan),
+        np.where(vct_found, np.sqrt(vct_mse), np.nan),
+    )
+
+
+def _fit_rating_curves_loop(vct_hobs, grd_qt, vct_h0):
+    """Loop kernel of :func:`fit_rating_curves`, compiled by numba if available
+
+    :param vct_hobs: observed stage
+    :type vct_hobs: :class:`numpy.ndarray`
+    :param grd_qt: log of observed discharge realizations, shape (runsize, n)
+    :type grd_qt: :class:`numpy.ndarray`
+    :param vct_h0: grid of h0 values
+    :type vct_h0: :class:`numpy.ndarray`
+    :return: best h0, a, b and transformed RMSE of each realization
+    :rtype: tuple
+    """
+    n_runs, n = grd_qt.shape
+    n_h0 = len(vct_h0)
+    # centered transformed stage of each h0 (shared by all realizations)
+    grd_ht_c = np.empty((n_h0, n))
+    vct_ht_mean = np.empty(n_h0)
+    vct_ht_ss = np.empty(n_h0)
+    for i in range(n_h0):
+        vct_ht = np.log(vct_hobs - vct_h0[i])
+        vct_ht_mean[i] = vct_ht.mean()
+        grd_ht_c[i] = vct_ht - vct_ht_mean[i]
+        vct_ht_ss[i] = np.sum(grd_ht_c[i] * grd_ht_c[i])
+    vct_h0_best = np.empty(n_runs)
+    vct_a = np.empty(n_runs)
+    vct_b = np.empty(n_runs)
+    vct_rmse = np.empty(n_runs)
+    # fit realizations in parallel
+    for r in prange(n_runs):
+        n_qt_mean = grd_qt[r].mean()
+        vct_qt_c = grd_qt[r] - n_qt_mean
+        n_mse_best = np.inf
+        i_best = -1
+        n_b_best = 0.0
+        for i in range(n_h0):
+            n_b = np.sum(vct_qt_c * grd_ht_c[i]) / vct_ht_ss[i]
+            n_mse = np.mean(np.square(vct_qt_c - n_b * grd_ht_c[i]))
+            # NaN and inf fits never compare lower (non-finite fits are skipped)
+            if n_mse < n_mse_best:
+                n_mse_best = n_mse
+                i_best = i
+                n_b_best = n_b
+        if i_best < 0:
+            # no finite fit
+            vct_h0_best[r] = np.nan
+            vct_a[r] = np.nan
+            vct_b[r] = np.nan
+            vct_rmse[r] = np.nan
+        else:
+            vct_h0_best[r] = vct_h0[i_best]
+            vct_a[r] = np.exp(n_qt_mean - n_b_best * vct_ht_mean[i_best])
+            vct_b[r] = n_b_best
+            vct_rmse[r] = np.sqrt(n_mse_best)
+    return vct_h0_best, vct_a, vct_b, vct_rmse
+
+
+# use the compiled kernel if numba is available
+if njit is None:
+    _fit_rating_curves_jit = None
+else:
+    _fit_rating_curves_jit = njit(cache=True, parallel=True)(_fit_rating_curves_loop)
+
+
 # -----------------------------------------
 # Series data structures
 
@@ -2656,6 +2783,14 @@ class RatingCurve:
         self.e_sd = None
         self.et_mean = None
         self.et_sd = None
+        # cache of (Qobs, ln(Qobs)) for the transformed model
+        self._qt_cache = None
+
+    def __setattr__(self, name, value):
+        # any public attribute change makes the cached metadata dirty
+        if not name.startswith("_"):
+            object.__setattr__(self, "_meta_cache", None)
+        object.__setattr__(self, name, value)
 
     def __str__(self):
         dct_meta = self.get_metadata()
@@ -2675,7 +2810,13 @@ class RatingCurve:
         :return: computed Q
         :rtype: :class:`numpy.ndarray`` or float
         """
-        return self.a * (np.power((h - self.h0), self.b))
+        vct_q = np.subtract(h, self.h0, dtype=np.float64)
+        if np.ndim(vct_q) == 0:
+            return self.a * np.power(vct_q, self.b)
+        # compute in place over the single temporary
+        np.power(vct_q, self.b, out=vct_q)
+        vct_q *= self.a
+        return vct_q
 
     def extrapolate(self, hmin=None, hmax=None, n_samples=100):
         """Extrapolate Rating Curve model. Data is expected to be loaded.
@@ -2730,10 +2871,11 @@ class RatingCurve:
         if self.data is None:
             pass
         else:
-            from plans.analyst import Bivar
-
-            # sort values by H
-            self.data = self.data.sort_values(by=self.field_hobs).reset_index(drop=True)
+            # sort values by H (only if needed)
+            if not self.data[self.field_hobs].is_monotonic_increasing:
+                self.data = self.data.sort_values(by=self.field_hobs).reset_index(
+                    drop=True
+                )
 
             # get model values (reverse transform)
             self.data[self.field_qobs + "_Mean"] = self.run(
@@ -2748,8 +2890,13 @@ class RatingCurve:
             self.data[self.field_ht] = self.data[self.field_hobs] - self.h0
             # get second transform on H
             self.data[self.field_htt] = np.log(self.data[self.field_ht])
-            # get transform on Q
-            self.data[self.field_qt] = np.log(self.data[self.field_qobs])
+            # get transform on Q (reuse it if Qobs is unchanged)
+            vct_qobs = self.data[self.field_qobs].values
+            if self._qt_cache is None or not np.array_equal(
+                self._qt_cache[0], vct_qobs, equal_nan=True
+            ):
+                self._qt_cache = (vct_qobs.copy(), np.log(vct_qobs))
+            self.data[self.field_qt] = self._qt_cache[1]
 
             # get transformed Linear params
             c0t = np.log(self.a)
@@ -2777,7 +2924,9 @@ class RatingCurve:
         :return: metadata
         :rtype: dict
         """
-        return {
+        if self._meta_cache is not None:
+            return self._meta_cache.copy()
+        self._meta_cache = {
             "Name": self.name,
             "Date_Start": self.date_start,
             "Date_End": self.date_end,
@@ -2797,6 +2946,7 @@ class RatingCurve:
             "Source": self.source_data,
             "Description": self.description,
         }
+        return self._meta_cache.copy()
 
     def load(
         self,
@@ -2855,47 +3005,24 @@ class RatingCurve:
         :return: None
         :rtype: None
         """
-        from plans.analyst import Bivar
-
         # estimate h0
         _h0_max = self.data[self.field_hobs].min()
         # get range of h0
         _h0_values = np.linspace(0, 0.99 * _h0_max, n_grid)
-        # set fit dataframe
-        _df_fits = pd.DataFrame(
-            {
-                "h0": _h0_values,
-                "b": np.zeros(n_grid),
-                "a": np.zeros(n_grid),
-                "RMSE": np.zeros(n_grid),
-            }
+        # get observed values (skip missing records)
+        _vct_h = self.data[self.field_hobs].values
+        _vct_yt = np.log(self.data[self.field_qobs].values)
+        _mask = ~(np.isnan(_vct_h) | np.isnan(_vct_yt))
+        _vct_h = _vct_h[_mask]
+        _vct_yt = _vct_yt[_mask]
+
+        # fit all h0 values at once and pick the best fit
+        vct_h0, vct_a, vct_b, _ = fit_rating_curves(
+            vct_hobs=_vct_h, grd_qt=_vct_yt[None, :], vct_h0=_h0_values
         )
-        _df_fits.insert(0, "Model", "")
-        # search loop
-        for i in range(len(_df_fits)):
-            # get h0
-            n_h0 = _df_fits["h0"].values[i]
-            # get transformed variables
-            self.update(h0=n_h0)
-
-            # set Bivar base_object for tranformed linear model
-            biv = Bivar(df_data=self.data, x_name=self.field_htt, y_name=self.field_qt)
-            # fit linear model
-            biv.fit(model_type="Linear")
-            ###biv.view()
-            # retrieve re-transformed values
-            _df_fits["a"].values[i] = np.exp(
-                biv.models["Linear"]["Setup"]["Mean"].values[0]
-            )
-            _df_fits["b"].values[i] = biv.models["Linear"]["Setup"]["Mean"].values[1]
-            _df_fits["RMSE"].values[i] = biv.models["Linear"]["RMSE"]
-
-        # sort by metric
-        _df_fits = _df_fits.sort_values(by="RMSE").reset_index(drop=True)
-
-        self.h0 = _df_fits["h0"].values[0]
-        self.a = _df_fits["a"].values[0]
-        self.b = _df_fits["b"].values[0]
+        self.h0 = vct_h0[0]
+        self.a = vct_a[0]
+        self.b = vct_b[0]
         self.update()
         return None
 
@@ -2915,15 +3042,8 @@ class RatingCurve:
         :return: dictionary with output dataframes
         :rtype: dict
         """
-        from plans.analyst import Univar
-
-        # random state setup
-        if seed is None:
-            from datetime import datetime
-
-            np.random.seed(int(datetime.now().timestamp()))
-        else:
-            np.random.seed(seed)
+        # local random generator setup (fresh entropy if seed is None)
+        rng = np.random.default_rng(seed)
 
         # ensure model is up-to-date
         self.update()
@@ -2931,50 +3051,37 @@ class RatingCurve:
         # resample error
 
         # get the transform error datasets:
-        grd_et = np.random.normal(
-            loc=0, scale=self.et_sd, size=(runsize, len(self.data))
+        grd_et = rng.standard_normal(size=(runsize, len(self.data))) * self.et_sd
+        # re-calc qobs_t for all error realizations (in place, no temporary)
+        grd_qt = grd_et
+        grd_qt += self.data["{}_Mean".format(self.field_qt)].values[None, :]
+
+        # fit all error realizations at once
+        if talk:
+            print("Processing models...")
+        vct_hobs = self.data[self.field_hobs].values
+        vct_h0, vct_a, vct_b, _ = fit_rating_curves(
+            vct_hobs=vct_hobs,
+            grd_qt=grd_qt,
+            vct_h0=np.linspace(0, 0.99 * vct_hobs.min(), 10),
         )
-        # re-calc qobs_t for all error realizations
-        grd_qt = grd_et + np.array([self.data["{}_Mean".format(self.field_qt)].values])
-        # re-calc qobs
-        grd_qobs = np.exp(grd_qt)
 
-        # setup of montecarlo dataframe
+        # set montecarlo dataframe at once
+        n_fill = int(np.log10(runsize)) + 1
         mc_models_df = pd.DataFrame(
             {
-                "Id": [
-                    "MC{}".format(str(i + 1).zfill(int(np.log10(runsize)) + 1))
-                    for i in range(runsize)
-                ],
-                self.name_h0: np.zeros(runsize),
-                self.name_a: np.zeros(runsize),
-                self.name_b: np.zeros(runsize),
+                "Id": ["MC{}".format(str(i + 1).zfill(n_fill)) for i in range(runsize)],
+                self.name_h0: vct_h0,
+                self.name_a: vct_a,
+                self.name_b: vct_b,
             }
         )
-        # set up simulation data
-        grd_qsim = np.zeros(shape=(runsize, n_samples))
 
-        # for each error realization, fit model and extrapolate
-        if talk:
-            print("Processing models...")
-        for i in range(runsize):
-            # set new qobs
-            self.data[self.field_qobs] = grd_qobs[i]
-            # update
-            self.update()
-            # fit
-            self.fit(n_grid=10)
-            # extrapolate
-            hmax = self.hmax * extrap_f
-            _df_ex = self.extrapolate(hmin=0, hmax=hmax, n_samples=n_samples)
-            # store results
-            grd_qsim[i] = _df_ex[self.field_q].values
-            mc_models_df[self.name_h0].values[i] = self.h0
-            mc_models_df[self.name_a].values[i] = self.a
-            mc_models_df[self.name_b].values[i] = self.b
-
-        # extract h values
-        vct_h = _df_ex[self.field_h].values
+        # extrapolate all models at once
+        vct_h = np.linspace(0, self.hmax * extrap_f, n_samples)
+        grd_qsim = vct_h[None, :] - vct_h0[:, None]
+        np.power(grd_qsim, vct_b[:, None], out=grd_qsim)
+        grd_qsim *= vct_a[:, None]
         # transpose data
         grd_qsim_t = np.transpose(grd_qsim)
 
@@ -2992,29 +3099,29 @@ class RatingCurve:
         del grd_qsim
         del grd_qsim_t
 
-        # set up stats data
-        df_sts_dumm = Univar(data=np.ones(10)).assess_basic_stats()
-        grd_stats = np.zeros(shape=(len(mc_sim_df), len(df_sts_dumm)))
-
-        # retrieve stats from simulation
+        # retrieve stats from simulation (same as ``Univar.assess_basic_stats``)
         if talk:
             print("Processing bands...")
-        for i in range(len(mc_sim_df)):
-            vct_data = mc_sim_df.values[i][1:]
-            uni = Univar(data=vct_data)
-            _df_stats = uni.assess_basic_stats()
-            grd_stats[i] = _df_stats["Value"].values
+        grd_sim = mc_sim_df.values[:, 1:]
+        dct_stats = {
+            "Count": np.full(len(grd_sim), float(grd_sim.shape[1])),
+            "Sum": np.sum(grd_sim, axis=1),
+            "Mean": np.mean(grd_sim, axis=1),
+            "SD": np.std(grd_sim, axis=1),
+            "Min": np.min(grd_sim, axis=1),
+        }
+        lst_pcts = [1, 5, 25, 50, 75, 90, 95, 99]
+        grd_pcts = np.percentile(grd_sim, lst_pcts, axis=1)
+        for i in range(len(lst_pcts)):
+            dct_stats["p{}".format(str(lst_pcts[i]).zfill(2))] = grd_pcts[i]
+        dct_stats["Max"] = np.max(grd_sim, axis=1)
 
         # set up stats dataframe
         mc_stats_df = pd.DataFrame(
-            columns=[
-                "Q_{}".format(df_sts_dumm["Statistic"].values[i])
-                for i in range(len(df_sts_dumm))
-            ],
-            data=grd_stats,
+            {"Q_{}".format(k): dct_stats[k] for k in dct_stats}
         )
         mc_stats_df.insert(0, column=self.field_h, value=mc_sim_df[self.field_h])
-        del grd_stats
+        del grd_sim
 
         # return objects
         return {
@@ -3219,8 +3326,7 @@ class RatingCurveCollection(Collection):
         if specs is None:
             pass
         else:  # override default
-            for k in specs:
-                default_specs[k] = specs[k]
+            default_specs.update(specs)
         specs = default_specs
 
         # Deploy figure
@@ -3228,12 +3334,12 @@ class RatingCurveCollection(Collection):
         fig.suptitle(specs["suptitle"])
 
         self.update(details=True)
-        for i in range(len(self.catalog)):
-            s_name = self.catalog["Name"].values[i]
-            _df = self.collection[s_name].data
-            _hfield = self.collection[s_name].field_hobs
-            _qfield = self.collection[s_name].field_qobs
-            plt.scatter(_df[_hfield], _df[_qfield], marker=".", color=lst_colors[i])
+        # gather all curves into flat arrays for a single scatter call
+        lst_rcs = [self.collection[s_name] for s_name in self.catalog["Name"].values]
+        vct_h = np.concatenate([rc.data[rc.field_hobs].values for rc in lst_rcs])
+        vct_q = np.concatenate([rc.data[rc.field_qobs].values for rc in lst_rcs])
+        vct_colors = np.repeat(lst_colors, [len(rc.data) for rc in lst_rcs])
+        plt.scatter(vct_h, vct_q, marker=".", color=vct_colors)
 
         plt.xlim(specs["xmin"], specs["xmax"])
 
@@ -6994,8 +7100,7 @@ class QualiRasterSeries(RasterSeries):
         if specs is None:
             pass
         else:  # override default
-            for k in specs:
-                default_specs[k] = specs[k]
+            default_specs.update(specs)
         specs = default_specs
 
         # compute export_areas
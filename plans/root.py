@@ -235,6 +235,13 @@ class Collection(MbaE):
         self.baseobject = base_object
         self.baseobject_name = base_object.__name__
 
+        # Initialize the buffers of pending catalog changes
+        self._cols = dict()
+        self._names = list()
+        self._names_idx = dict()
+        self._removed = set()
+        self._dirty = False
+
         # Initialize the catalog with an empty DataFrame
         dict_metadata = self.baseobject().get_metadata()
 
@@ -300,6 +307,58 @@ class Collection(MbaE):
         dict_meta.update(dict_meta_local)
         return dict_meta
 
+    @property
+    def catalog(self):
+        """The ``Collection`` catalog.
+
+        Changes from ``append()`` and ``remove()`` are buffered and only
+        merged into the catalog when it is read.
+
+        :return: catalog with the metadata of the objects
+        :rtype: :class:`pandas.DataFrame`
+        """
+        if self._dirty:
+            self._flush_catalog()
+        return self._catalog
+
+    @catalog.setter
+    def catalog(self, df_catalog):
+        # overwrite pending changes with empty columns (one list per field)
+        self._cols = {k: [] for k in df_catalog.columns}
+        self._names = list()
+        self._names_idx = dict()
+        self._removed = set()
+        self._dirty = False
+        self._catalog = df_catalog
+
+    def _flush_catalog(self):
+        """Merge pending changes into the catalog.
+
+        :return: None
+        :rtype: None
+        """
+        # --- the first row is expected to be the Unique name
+        df_catalog = self._catalog
+        str_unique_name = df_catalog.columns[0]
+
+        # drop removed and replaced objects in a single hashed lookup
+        set_drop = self._removed.union(self._names_idx.keys())
+        if len(set_drop) > 0 and len(df_catalog) > 0:
+            df_catalog = df_catalog[~df_catalog[str_unique_name].isin(set_drop)]
+
+        # append new objects in a single concat (new fields extend the columns)
+        if len(self._names_idx) > 0:
+            df_aux = pd.DataFrame(self._cols)
+            if len(df_catalog) == 0:
+                df_catalog = df_aux
+            else:
+                df_catalog = pd.concat([df_catalog, df_aux], ignore_index=True)
+            df_catalog = df_catalog.sort_values(by=str_unique_name)
+
+        # reset buffers
+        self.catalog = df_catalog.reset_index(drop=True)
+        return None
+
     def update(self, details=False):
         """Update the ``Collection`` catalog.
 
@@ -311,25 +370,16 @@ class Collection(MbaE):
 
         # Update details if specified
         if details:
-            # Create a new empty catalog
-            df_new_catalog = pd.DataFrame(columns=self.catalog.columns)
-
-            # retrieve details from collection
-            for name in self.collection:
-                # retrieve updated metadata from base object
-                dct_meta = self.collection[name].get_metadata()
+            # retrieve updated metadata from all objects in the collection
+            lst_records = [
+                self.collection[name].get_metadata() for name in self.collection
+            ]
 
-                # set up a single-row helper dataframe
-                lst_keys = dct_meta.keys()
-                _dct = dict()
-                for k in lst_keys:
-                    _dct[k] = [dct_meta[k]]
-
-                # Set new information
-                df_aux = pd.DataFrame(_dct)
-
-                # Append to the new catalog
-                df_new_catalog = pd.concat([df_new_catalog, df_aux], ignore_index=True)
+            # Build the new catalog at once, keeping the catalog fields first
+            df_new_catalog = pd.DataFrame.from_records(lst_records)
+            lst_fields = list(self.catalog.columns)
+            lst_fields += [f for f in df_new_catalog.columns if f not in lst_fields]
+            df_new_catalog = df_new_catalog.reindex(columns=lst_fields)
 
             # consider if the name itself has changed in the
             old_key_names = list(self.collection.keys())[:]
@@ -376,15 +426,26 @@ class Collection(MbaE):
         copied_object = copy.deepcopy(new_object)
         self.collection[new_object.name] = copied_object
 
-        # Update the catalog with the new object's metadata
-        dct_meta = new_object.get_metadata()
-        dct_meta_df = dict()
-        for k in dct_meta:
-            dct_meta_df[k] = [dct_meta[k]]
-        df_aux = pd.DataFrame(dct_meta_df)
-        self.catalog = pd.concat([self.catalog, df_aux], ignore_index=True)
+        # Buffer the new object's metadata for the catalog, field by field
+        dict_meta = new_object.get_metadata()
+        # new fields get a column padded with None for earlier pending rows
+        for k in dict_meta:
+            if k not in self._cols:
+                self._cols[k] = [None] * len(self._names)
+        n_row = self._names_idx.get(new_object.name)
+        if n_row is None:
+            self._names_idx[new_object.name] = len(self._names)
+            self._names.append(new_object.name)
+            for k in self._cols:
+                self._cols[k].append(dict_meta.get(k))
+        else:
+            # replace the pending row of the same object
+            for k in self._cols:
+                self._cols[k][n_row] = dict_meta.get(k)
+        self._removed.discard(new_object.name)
+        self._dirty = True
 
-        self.update()
+        self.size = len(self.collection)
         return None
 
     def remove(self, name):
@@ -398,14 +459,19 @@ class Collection(MbaE):
         """
         # Delete the object from the ``Collection``
         del self.collection[name]
-        # Delete the object's entry from the catalog
-        str_unique_name = self.catalog.columns[
-            0
-        ]  # assuming the first column is the unique name
-        self.catalog = self.catalog.drop(
-            self.catalog[self.catalog[str_unique_name] == name].index
-        ).reset_index(drop=True)
-        self.update()
+        # Buffer the removal of the object's entry from the catalog
+        n_row = self._names_idx.pop(name, None)
+        if n_row is not None:
+            # swap the last pending row into the freed slot
+            for lst in [self._names] + list(self._cols.values()):
+                lst[n_row] = lst[-1]
+                lst.pop()
+            if n_row < len(self._names):
+                self._names_idx[self._names[n_row]] = n_row
+        self._removed.add(name)
+        self._dirty = True
+
+        self.size = len(self.collection)
         return None
 
 
@@ -1,7 +1,11 @@
 import unittest
+from unittest import mock
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from plans.ds import TimeSeries, Collection
+from plans import ds
+from plans.ds import TimeSeries, Collection, fit_rating_curves
+from plans import datasets
 
 
 class TestObject:
@@ -116,6 +120,129 @@ class TestTimeSeries(unittest.TestCase):
         self.ts = None
 
 
+class TestFitRatingCurves(unittest.TestCase):
+    def setUp(self):
+        # exact realizations of Q = a * (H - h0)^b with h0 on the search grid
+        self.vct_h0 = np.linspace(0, 0.9, 10)
+        self.vct_hobs = np.linspace(1, 5, 50)
+        self.lst_params = [(2.5, 1.7, 5), (1.2, 2.0, 2)]  # a, b, h0 id
+        self.grd_qt = np.array(
+            [
+                np.log(a) + b * np.log(self.vct_hobs - self.vct_h0[i])
+                for a, b, i in self.lst_params
+            ]
+        )
+
+    def test_recover_parameters(self):
+        vct_h0, vct_a, vct_b, vct_rmse = fit_rating_curves(
+            vct_hobs=self.vct_hobs, grd_qt=self.grd_qt, vct_h0=self.vct_h0
+        )
+        for j, (a, b, i) in enumerate(self.lst_params):
+            self.assertEqual(vct_h0[j], self.vct_h0[i])
+            self.assertAlmostEqual(vct_a[j], a, places=6)
+            self.assertAlmostEqual(vct_b[j], b, places=6)
+            self.assertAlmostEqual(vct_rmse[j], 0.0, places=6)
+
+    def test_single_realization(self):
+        # a 1d realization is fitted as a single run
+        vct_h0, vct_a, vct_b, _ = fit_rating_curves(
+            vct_hobs=self.vct_hobs, grd_qt=self.grd_qt[0], vct_h0=self.vct_h0
+        )
+        self.assertEqual(len(vct_h0), 1)
+        self.assertAlmostEqual(vct_a[0], self.lst_params[0][0], places=6)
+        self.assertAlmostEqual(vct_b[0], self.lst_params[0][1], places=6)
+
+    def test_loop_kernel_matches_numpy(self):
+        rng = np.random.default_rng(7)
+        grd_qt = np.vstack(
+            [self.grd_qt, self.grd_qt + rng.normal(scale=0.05, size=self.grd_qt.shape)]
+        )
+        # a realization with a missing record has no finite fit
+        grd_qt[1, 10] = np.nan
+        # h0 candidates above the lowest stage give non-finite fits
+        vct_h0 = np.append(self.vct_h0, [1.5, 2.0])
+        # loop kernel as plain python (numba prange runs as range when not compiled)
+        tpl_loop = ds._fit_rating_curves_loop(self.vct_hobs, grd_qt, vct_h0)
+        # numpy path
+        with mock.patch.object(ds, "_fit_rating_curves_jit", None):
+            tpl_numpy = fit_rating_curves(
+                vct_hobs=self.vct_hobs, grd_qt=grd_qt, vct_h0=vct_h0
+            )
+        for vct_loop, vct_numpy in zip(tpl_loop, tpl_numpy):
+            np.testing.assert_allclose(
+                vct_loop, vct_numpy, rtol=1e-9, atol=1e-12, equal_nan=True
+            )
+        # the missing record realization is NaN, the others are fitted
+        self.assertTrue(np.isnan(tpl_numpy[2][1]))
+        self.assertTrue(np.isfinite(np.delete(tpl_numpy[2], 1)).all())
+
+
+class TestZones(unittest.TestCase):
+    def setUp(self):
+        self.metadata = {
+            "ncols": 3,
+            "nrows": 2,
+            "xllcorner": 0,
+            "yllcorner": 0,
+            "cellsize": 1,
+            "NODATA_value": 0,
+        }
+        self.grid = np.array([[3, 1, 2], [0, 3, 1]], dtype="uint32")
+        self.zones = datasets.Zones()
+        self.zones.set_asc_metadata(metadata=self.metadata)
+        self.zones.set_grid(grid=self.grid)
+
+    def test_set_table(self):
+        # sorted ids without nodata, with random colors
+        self.assertListEqual(list(self.zones.table["Id"]), [1, 2, 3])
+        self.assertListEqual(list(self.zones.table["Alias"]), ["ZN1", "ZN2", "ZN3"])
+        self.assertListEqual(
+            list(self.zones.table["Name"]), ["Zone 1", "Zone 2", "Zone 3"]
+        )
+        self.assertIn("Color", self.zones.table.columns)
+
+    def test_get_aoi(self):
+        map_aoi = self.zones.get_aoi(zone_id=3)
+        self.assertIsInstance(map_aoi, datasets.AOI)
+        np.testing.assert_array_equal(
+            np.ma.filled(map_aoi.grid, 0), [[1, 0, 0], [0, 1, 0]]
+        )
+        # the zones grid is left as is
+        np.testing.assert_array_equal(np.ma.filled(self.zones.grid, 0), self.grid)
+
+    def tearDown(self):
+        self.zones = None
+
+
+class TestQualiRaster(unittest.TestCase):
+    def setUp(self):
+        self.grid = np.array([[3, 1, 2], [0, 3, 1]], dtype="uint8")
+        self.qr = datasets.QualiRaster()
+        self.qr.set_asc_metadata(
+            metadata={
+                "ncols": 3,
+                "nrows": 2,
+                "xllcorner": 0,
+                "yllcorner": 0,
+                "cellsize": 1,
+                "NODATA_value": 0,
+            }
+        )
+        self.qr.set_grid(grid=self.grid)
+
+    def test_get_aoi(self):
+        map_aoi = self.qr.get_aoi(by_value_id=1)
+        self.assertIsInstance(map_aoi, datasets.AOI)
+        np.testing.assert_array_equal(
+            np.ma.filled(map_aoi.grid, 0), [[0, 1, 0], [0, 0, 1]]
+        )
+        # the raster grid is left as is
+        np.testing.assert_array_equal(np.ma.filled(self.qr.grid, 0), self.grid)
+
+    def tearDown(self):
+        self.qr = None
+
+
 # --------------------- TEST OBJECTS ---------------------- #
 
 
@@ -1,7 +1,11 @@
 import os
+import importlib.util
+import tempfile
 import unittest, warnings
+import numpy as np
 import pandas as pd
 from plans import datasets
+from plans.datasets.core import _moving_stat
 from tests import core
 import matplotlib.pyplot as plt
 plt.style.use("seaborn-v0_8")
@@ -274,5 +278,184 @@ class TestTempSeries(TestTimeSeries):
         )
 
 
+class TestTimeSeriesKernels(unittest.TestCase):
+    """Check the vectorized TimeSeries kernels against plain pandas."""
+
+    def setUp(self):
+        # hourly synthetic series: random gaps, a full day gap and unsorted records
+        rng = np.random.default_rng(42)
+        n_size = 24 * 10
+        vct_values = rng.normal(loc=10, scale=3, size=n_size)
+        vct_values[rng.random(n_size) < 0.1] = np.nan
+        vct_values[48:72] = np.nan
+        df = pd.DataFrame(
+            {
+                "Date": pd.date_range("2020-01-01", periods=n_size, freq="60min"),
+                "V": vct_values,
+            }
+        )
+        df = df.sample(frac=1, random_state=1).reset_index(drop=True)
+
+        # create instance
+        self.ts = datasets.TimeSeries(name="Synthetic", alias="Syn")
+        # set attributes
+        self.ts.varfield = "V"
+        self.ts.varname = "Var"
+        self.ts.units = "u"
+        self.ts.set_data(
+            input_df=df, input_dtfield="Date", input_varfield="V", dropnan=False
+        )
+        # expected reference: sorted series indexed by datetime
+        self.sr = (
+            self.ts.data.set_index(self.ts.dtfield)[self.ts.varfield]
+            .astype("float64")
+            .sort_index()
+        )
+
+    def test_aggregate_default_fields(self):
+        df = self.ts.aggregate(freq="D", bad_max=24)
+        lst_expected = [self.ts.dtfield] + [
+            "V_{}".format(f)
+            for f in ["sum", "mean", "median", "min", "max", "std", "var"]
+        ]
+        self.assertListEqual(list(df.columns), lst_expected)
+
+    def test_aggregate_percentiles(self):
+        lst_percentiles = [5, 25, 50, 75, 95]
+        df = self.ts.aggregate(freq="D", bad_max=24, percentiles=lst_percentiles)
+        for p in lst_percentiles:
+            sr_expected = self.sr.resample("D").quantile(p / 100)
+            np.testing.assert_allclose(
+                df["V_p{}".format(p)].to_numpy(dtype="float64"),
+                sr_expected.to_numpy(),
+                rtol=1e-5,
+                equal_nan=True,
+            )
+
+    def test_resample_sum(self):
+        for freq in ["6h", "D"]:
+            df = self.ts.resample_sum(freq=freq)
+            sr_expected = self.sr.resample(freq).sum(min_count=1)
+            self.assertTrue((df[self.ts.dtfield].values == sr_expected.index.values).all())
+            np.testing.assert_allclose(
+                df[self.ts.varfield].to_numpy(dtype="float64"),
+                sr_expected.to_numpy(),
+                rtol=1e-5,
+                equal_nan=True,
+            )
+        # the day without valid records is NaN, not a zero sum
+        df = self.ts.resample_sum(freq="D")
+        self.assertTrue(np.isnan(df[self.ts.varfield].values[2]))
+
+    def test_resample_mean(self):
+        for freq in ["6h", "D"]:
+            df = self.ts.resample_mean(freq=freq)
+            sr_expected = self.sr.resample(freq).mean()
+            self.assertTrue((df[self.ts.dtfield].values == sr_expected.index.values).all())
+            np.testing.assert_allclose(
+                df[self.ts.varfield].to_numpy(dtype="float64"),
+                sr_expected.to_numpy(),
+                rtol=1e-5,
+                equal_nan=True,
+            )
+
+    @unittest.skipIf(
+        importlib.util.find_spec("pyarrow") is None, "parquet export requires pyarrow"
+    )
+    def test_export_parquet(self):
+        with tempfile.TemporaryDirectory() as folder:
+            self.ts.export(folder=folder, fmt="parquet")
+            file_path = "{}/{}_{}.parquet".format(
+                folder, self.ts.varname, self.ts.alias
+            )
+            core.assert_file_exists(file_path=file_path)
+            df = pd.read_parquet(file_path)
+        pd.testing.assert_frame_equal(
+            df, self.ts.data.reset_index(drop=True), check_dtype=False
+        )
+
+    def test_export_csv(self):
+        with tempfile.TemporaryDirectory() as folder:
+            self.ts.export(folder=folder)
+            file_path = "{}/{}_{}.csv".format(folder, self.ts.varname, self.ts.alias)
+            core.assert_file_exists(file_path=file_path)
+            self.assertFalse(
+                any(f.endswith(".parquet") for f in os.listdir(folder))
+            )
+            df = pd.read_csv(file_path, sep=";", parse_dates=[self.ts.dtfield])
+        np.testing.assert_allclose(
+            df[self.ts.varfield].to_numpy(),
+            self.ts.data[self.ts.varfield].to_numpy(dtype="float64"),
+            rtol=1e-6,
+            equal_nan=True,
+        )
+
+    def test_export_bad_format(self):
+        with tempfile.TemporaryDirectory() as folder:
+            with self.assertRaises(ValueError):
+                self.ts.export(folder=folder, fmt="xlsx")
+            # nothing is written
+            self.assertListEqual(os.listdir(folder), [])
+
+    def test_moving_stat(self):
+        # records in the stored (unsorted) order, as the kernel sees them
+        sr = self.ts.data[self.ts.varfield].astype("float64").reset_index(drop=True)
+        for stat in ["mean", "sum", "std", "min", "max", "median"]:
+            for window, min_periods in [(1, 1), (3, 1), (3, 3), (24, 2), (24, 12)]:
+                vct = _moving_stat(
+                    sr.to_numpy(), window=window, stat=stat, min_periods=min_periods
+                )
+                sr_expected = sr.rolling(window, min_periods=min_periods).agg(stat)
+                np.testing.assert_allclose(
+                    vct,
+                    sr_expected.to_numpy(),
+                    rtol=1e-7,
+                    atol=1e-9,
+                    equal_nan=True,
+                    err_msg="stat={} window={} min_periods={}".format(
+                        stat, window, min_periods
+                    ),
+                )
+
+    def test_moving_stat_bad_stat(self):
+        with self.assertRaises(ValueError):
+            _moving_stat(np.arange(5.0), window=2, stat="mode")
+
+    def test_moving_stat_cache(self):
+        sr = self.ts.data[self.ts.varfield].astype("float64").reset_index(drop=True)
+        vct_mean = self.ts.get_moving_stat(period=6, stat="mean")
+        # a second stat of the same period must not hit the cached mean
+        vct_max = self.ts.get_moving_stat(period=6, stat="max")
+        np.testing.assert_allclose(
+            vct_max,
+            sr.rolling(6, min_periods=2).max().to_numpy(),
+            equal_nan=True,
+        )
+        self.assertFalse(np.array_equal(vct_mean, vct_max, equal_nan=True))
+        # and the mean is recomputed right after
+        np.testing.assert_allclose(
+            self.ts.get_moving_stat(period=6, stat="mean"),
+            sr.rolling(6, min_periods=2).mean().to_numpy(),
+            rtol=1e-7,
+            equal_nan=True,
+        )
+
+    def test_moving_stat_cache_version(self):
+        vct_mean = self.ts.get_moving_stat(period=6, stat="mean")
+        # same setup and data: the cached array is returned
+        self.assertIs(self.ts.get_moving_stat(period=6, stat="mean"), vct_mean)
+        # a data change bumps the version and invalidates the cache
+        self.ts.data[self.ts.varfield] = 2 * self.ts.data[self.ts.varfield]
+        self.ts.update()
+        vct_new = self.ts.get_moving_stat(period=6, stat="mean")
+        self.assertIsNot(vct_new, vct_mean)
+        np.testing.assert_allclose(vct_new, 2 * vct_mean, rtol=1e-6, equal_nan=True)
+
+    def tearDown(self):
+        # Clean up any resources created in the setUp method
+        self.ts = None
+        self.sr = None
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file